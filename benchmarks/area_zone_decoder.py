@@ -0,0 +1,147 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Micro-benchmark VEDO area and zone object building."""
+
+import asyncio
+import functools
+import itertools
+from typing import Any
+
+from common import CountOption, get_arguments, measure, polls_option
+
+from aiocomelit.const import (
+    ALARM_AREA_STATUS,
+    ALARM_ZONE_STATUS,
+    AlarmAreaState,
+    AlarmZoneState,
+)
+from aiocomelit.decoders import decode_areas, decode_zones
+from aiocomelit.models import ComelitVedoAreaObject, ComelitVedoZoneObject
+
+ZONE_STATUSES = ["0000", "0001", "0020", "0200", "8001", "0023", "8000"]
+AREA_FIELDS = (
+    "ready",
+    "armed",
+    "alarm",
+    "alarm_memory",
+    "sabotage",
+    "anomaly",
+    "in_time",
+    "out_time",
+)
+
+
+def build_pages(areas: int, zones: int) -> tuple[dict[str, Any], ...]:
+    """Build synthetic area_desc, area_stat, zone_desc and zone_stat pages."""
+    area_desc = {
+        "present": [1] * areas,
+        "description": [f"Area {index}" for index in range(areas)],
+        "p1_pres": [0] * areas,
+        "p2_pres": [0] * areas,
+    }
+    area_stat = {
+        field: [(index + offset) % 3 == 0 for index in range(areas)]
+        for offset, field in enumerate(AREA_FIELDS)
+    }
+    zone_desc = {
+        "present": ["1"] * zones,
+        "description": [f"Zone {index}" for index in range(zones)],
+    }
+    zone_stat = {
+        "status": ",".join(itertools.islice(itertools.cycle(ZONE_STATUSES), zones))
+    }
+    return area_desc, area_stat, zone_desc, zone_stat
+
+
+async def translate_area_status(area: ComelitVedoAreaObject) -> AlarmAreaState:
+    """Translate an area status the way _translate_area_status used to."""
+    for field in ALARM_AREA_STATUS:
+        if getattr(area, field):
+            return ALARM_AREA_STATUS[field]
+    return AlarmAreaState.DISARMED
+
+
+async def translate_zone_status(zone: ComelitVedoZoneObject) -> AlarmZoneState:
+    """Translate a zone status the way _translate_zone_status used to."""
+    for flag in ALARM_ZONE_STATUS:
+        if zone.status & flag != 0:
+            return ALARM_ZONE_STATUS[flag]
+    return AlarmZoneState.REST
+
+
+async def create_area_object(
+    area_desc: dict[str, Any], area_stat: dict[str, Any], index: int
+) -> ComelitVedoAreaObject:
+    """Build an area the way _create_area_object used to."""
+    area = ComelitVedoAreaObject(
+        index=index,
+        name=area_desc["description"][index],
+        p1=area_desc["p1_pres"][index],
+        p2=area_desc["p2_pres"][index],
+        ready=area_stat["ready"][index],
+        armed=area_stat["armed"][index],
+        alarm=area_stat["alarm"][index],
+        alarm_memory=area_stat["alarm_memory"][index],
+        sabotage=area_stat["sabotage"][index],
+        anomaly=area_stat["anomaly"][index],
+        in_time=area_stat["in_time"][index],
+        out_time=area_stat["out_time"][index],
+        human_status=AlarmAreaState.UNKNOWN,
+    )
+    area.human_status = await translate_area_status(area)
+    return area
+
+
+async def create_zone_object(
+    zone_desc: dict[str, Any], zone_stat: dict[str, Any], index: int
+) -> ComelitVedoZoneObject:
+    """Build a zone the way _create_zone_object used to."""
+    status_api = zone_stat["status"].split(",")[index]
+    zone = ComelitVedoZoneObject(
+        index=index,
+        name=zone_desc["description"][index],
+        status=int(status_api, 16),
+        status_api=status_api,
+        human_status=AlarmZoneState.UNKNOWN,
+    )
+    zone.human_status = await translate_zone_status(zone)
+    return zone
+
+
+async def coroutine_path(pages: tuple[dict[str, Any], ...]) -> None:
+    """Build every object with one coroutine per area and zone (previous)."""
+    area_desc, area_stat, zone_desc, zone_stat = pages
+    for index, present in enumerate(area_desc["present"]):
+        if present:
+            await create_area_object(area_desc, area_stat, index)
+    for index, present in enumerate(zone_desc["present"]):
+        if int(present):
+            await create_zone_object(zone_desc, zone_stat, index)
+
+
+async def one_pass(pages: tuple[dict[str, Any], ...]) -> None:
+    """Build every object with the synchronous one-pass decoders."""
+    area_desc, area_stat, zone_desc, zone_stat = pages
+    decode_areas(area_desc, area_stat)
+    decode_zones(zone_desc, zone_stat)
+
+
+async def main() -> None:
+    """Run main."""
+    args = get_arguments(
+        "area and zone decoder",
+        CountOption("areas", "a", 64, "Number of synthetic areas"),
+        CountOption("zones", "z", 512, "Number of synthetic zones"),
+        polls_option(100),
+    )
+    pages = build_pages(args.areas, args.zones)
+
+    await measure(
+        "coroutine path", functools.partial(coroutine_path, pages), args.polls
+    )
+    await measure("one pass", functools.partial(one_pass, pages), args.polls)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers shared by the aiocomelit benchmarks."""
+
+import time
+from argparse import ArgumentParser, Namespace
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CountOption:
+    """Integer command line option of a benchmark."""
+
+    name: str
+    short: str
+    default: int | list[int]
+    help: str
+
+
+def polls_option(default: int) -> CountOption:
+    """Return the option setting the number of simulated polls."""
+    return CountOption("polls", "p", default, "Number of simulated polls")
+
+
+def get_arguments(description: str, *options: CountOption) -> Namespace:
+    """Get parsed passed in arguments."""
+    parser = ArgumentParser(description=f"aiocomelit {description} benchmark")
+    for option in options:
+        parser.add_argument(
+            f"--{option.name}",
+            f"-{option.short}",
+            type=int,
+            nargs="+" if isinstance(option.default, list) else None,
+            default=option.default,
+            help=option.help,
+        )
+    return parser.parse_args()
+
+
+async def measure(
+    label: str,
+    poll: Callable[[], Awaitable[None]],
+    polls: int,
+) -> None:
+    """Run a poll coroutine function several times and report the mean cost."""
+    start = time.perf_counter()
+    for _ in range(polls):
+        await poll()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed / polls * 1000:10.3f} ms/poll")
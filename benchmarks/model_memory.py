@@ -0,0 +1,116 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark memory used by device, area and zone objects."""
+
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import MISSING, field, fields, make_dataclass
+from typing import Any
+
+from common import CountOption, get_arguments
+
+from aiocomelit.const import LIGHT, AlarmAreaState, AlarmZoneState
+from aiocomelit.models import (
+    ComelitSerialBridgeObject,
+    ComelitVedoAreaObject,
+    ComelitVedoZoneObject,
+)
+
+
+def unslotted(cls: type) -> type:
+    """Return a plain dataclass with the same fields as a model."""
+    return make_dataclass(
+        f"Plain{cls.__name__}",
+        [
+            (item.name, item.type, field(default=item.default))
+            if item.default is not MISSING
+            else (item.name, item.type)
+            for item in fields(cls)
+        ],
+    )
+
+
+def bridge_object(cls: type, index: int) -> Any:  # noqa: ANN401
+    """Build a synthetic Serial bridge device."""
+    return cls(
+        index=index,
+        name=f"Light {index}",
+        status=index % 2,
+        human_status="on" if index % 2 else "off",
+        type=LIGHT,
+        val=0,
+        protected=0,
+        zone="Living room",
+        power=0.0,
+    )
+
+
+def area_object(cls: type, index: int) -> Any:  # noqa: ANN401
+    """Build a synthetic VEDO area."""
+    return cls(
+        index=index,
+        name=f"Area {index}",
+        p1=False,
+        p2=False,
+        ready=True,
+        armed=0,
+        alarm=False,
+        alarm_memory=False,
+        sabotage=False,
+        anomaly=False,
+        in_time=False,
+        out_time=False,
+        human_status=AlarmAreaState.DISARMED,
+    )
+
+
+def zone_object(cls: type, index: int) -> Any:  # noqa: ANN401
+    """Build a synthetic VEDO zone."""
+    return cls(
+        index=index,
+        name=f"Zone {index}",
+        status_api="0000",
+        status=0,
+        human_status=AlarmZoneState.REST,
+    )
+
+
+def bytes_per_object(
+    cls: type,
+    build: Callable[[type, int], Any],
+    count: int,
+) -> float:
+    """Return the memory allocated per object while building many objects."""
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [build(cls, index) for index in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (end - start) / count
+
+
+def main() -> None:
+    """Run main."""
+    args = get_arguments(
+        "model memory",
+        CountOption("objects", "n", 100_000, "Number of synthetic objects per model"),
+    )
+
+    for model, build in (
+        (ComelitSerialBridgeObject, bridge_object),
+        (ComelitVedoAreaObject, area_object),
+        (ComelitVedoZoneObject, zone_object),
+    ):
+        plain = bytes_per_object(unslotted(model), build, args.objects)
+        slotted = bytes_per_object(model, build, args.objects)
+        print(
+            f"{model.__name__:<28} plain {plain:8.1f} B/object"
+            f"   slotted {slotted:8.1f} B/object"
+            f"   saved {1 - slotted / plain:6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
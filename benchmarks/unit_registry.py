@@ -0,0 +1,67 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark per-poll power parsing cost."""
+
+import asyncio
+import functools
+import time
+
+import pint
+from common import get_arguments, measure, polls_option
+
+from aiocomelit.const import WATT
+from aiocomelit.units import async_get_unit_registry, async_parse_power
+
+INSTANT_VALUES = ["", "0 W", "123 W", "1.2 kW", "45 W", "0.5 kW", "", "7 W"]
+
+
+def parse_instant_values(ureg: pint.UnitRegistry) -> list[float]:
+    """Convert counter values to watts the way get_all_devices does."""
+    powers: list[float] = []
+    for value in INSTANT_VALUES:
+        power = 0.0
+        instant = ureg(value)
+        if not instant.dimensionless:
+            power = ureg.convert(instant.magnitude, str(instant.units), WATT)
+        powers.append(power)
+    return powers
+
+
+async def poll_with_new_registry() -> None:
+    """Simulate one poll building a fresh registry (previous behavior)."""
+    loop = asyncio.get_running_loop()
+    ureg = await loop.run_in_executor(
+        None,
+        functools.partial(pint.UnitRegistry, cache_folder=":auto:"),
+    )
+    ureg.formatter.default_format = "~"
+    parse_instant_values(ureg)
+
+
+async def poll_with_shared_registry() -> None:
+    """Simulate one poll using the process-wide registry."""
+    parse_instant_values(await async_get_unit_registry())
+
+
+async def poll_with_fast_parser() -> None:
+    """Simulate one poll using the fast power parser."""
+    for value in INSTANT_VALUES:
+        await async_parse_power(value)
+
+
+async def main() -> None:
+    """Run main."""
+    args = get_arguments("unit registry", polls_option(20))
+
+    start = time.perf_counter()
+    await async_get_unit_registry()
+    print(f"{'warm-up':<24} {(time.perf_counter() - start) * 1000:10.3f} ms")
+
+    await measure("new registry", poll_with_new_registry, args.polls)
+    await measure("shared registry", poll_with_shared_registry, args.polls)
+    await measure("fast parser", poll_with_fast_parser, args.polls)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark VEDO zone status decoding on large synthetic installs."""
+
+import asyncio
+import functools
+import itertools
+
+from common import CountOption, get_arguments, measure, polls_option
+
+from aiocomelit.const import ALARM_ZONE_STATUS, AlarmZoneState
+from aiocomelit.decoders import decode_zone_statuses
+
+ZONE_STATUSES = ["0000", "0001", "0020", "0200", "8001", "0023", "8000"]
+
+
+async def translate_zone_status(status: int) -> AlarmZoneState:
+    """Translate a zone status the way _translate_zone_status used to."""
+    for flag in ALARM_ZONE_STATUS:
+        if status & flag != 0:
+            return ALARM_ZONE_STATUS[flag]
+    return AlarmZoneState.REST
+
+
+async def decode_per_zone(status: str, zones: int) -> None:
+    """Decode every zone splitting the status string each time (previous)."""
+    for index in range(zones):
+        status_api = status.split(",")[index]
+        await translate_zone_status(int(status_api, 16))
+
+
+async def decode_once(status: str, _zones: int) -> None:
+    """Decode every zone with a single pass over the status string."""
+    decode_zone_statuses(status)
+
+
+async def main() -> None:
+    """Run main."""
+    args = get_arguments(
+        "zone decoder",
+        CountOption("zones", "z", [64, 512, 2048], "Number of synthetic zones"),
+        polls_option(20),
+    )
+    for zones in args.zones:
+        status = ",".join(itertools.islice(itertools.cycle(ZONE_STATUSES), zones))
+        for name, decode in (
+            ("per zone", decode_per_zone),
+            ("single pass", decode_once),
+        ):
+            await measure(
+                f"{name:<12} {zones:>6} zones",
+                functools.partial(decode, status, zones),
+                args.polls,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,13 +5,7 @@
 
 __version__ = "2.0.7"
 
-from .api import (
-    ComeliteSerialBridgeApi,
-    ComelitSerialBridgeObject,
-    ComelitVedoApi,
-    ComelitVedoAreaObject,
-    ComelitVedoZoneObject,
-)
+from .api import ComeliteSerialBridgeApi, ComelitVedoApi
 from .exceptions import (
     CannotAuthenticate,
     CannotConnect,
@@ -19,16 +13,33 @@ from .exceptions import (
     ComelitError,
     DeviceStorageFailureError,
 )
+from .limiter import RateLimiter
+from .models import (
+    ComelitDeviceEvent,
+    ComelitEvent,
+    ComelitSerialBridgeObject,
+    ComelitVedoAreaEvent,
+    ComelitVedoAreaObject,
+    ComelitVedoZoneEvent,
+    ComelitVedoZoneObject,
+)
+from .units import async_get_unit_registry
 
 __all__ = [
     "CannotAuthenticate",
     "CannotConnect",
     "CannotRetrieveData",
+    "ComelitDeviceEvent",
     "ComelitError",
+    "ComelitEvent",
     "ComelitSerialBridgeObject",
     "ComelitVedoApi",
+    "ComelitVedoAreaEvent",
     "ComelitVedoAreaObject",
+    "ComelitVedoZoneEvent",
     "ComelitVedoZoneObject",
     "ComeliteSerialBridgeApi",
     "DeviceStorageFailureError",
+    "RateLimiter",
+    "async_get_unit_registry",
 ]
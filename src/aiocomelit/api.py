@@ -4,96 +4,154 @@
 """Support for Comelit SimpleHome."""
 
 import asyncio
+import copy
 import functools
+import logging
+import operator
 from abc import abstractmethod
-from collections.abc import Mapping
-from dataclasses import dataclass
+from collections.abc import AsyncGenerator, Awaitable, Iterable, Mapping
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
 from http import HTTPStatus
 from http.cookies import SimpleCookie
+from pathlib import Path
 from typing import Any, cast
 
 import orjson
-import pint
-from aiohttp import ClientConnectorError, ClientSession, ContentTypeError
+from aiohttp import ClientConnectorError, ClientSession
 from yarl import URL
 
+from .changes import ChangeTracker
 from .const import (
     _LOGGER,
+    ALARM_ACTION_ARMED,
+    ALARM_ALL_AREAS,
     ALARM_AREA,
     ALARM_AREA_STATUS,
     ALARM_ZONE,
-    ALARM_ZONE_STATUS,
     BRIDGE,
     CLIMATE,
+    CLIMATE_MODES,
+    CLIMATE_SET,
+    CLIMATE_SET_POINT,
     COVER,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_RATE_LIMIT,
     DEFAULT_TIMEOUT,
+    DEFAULT_WATCH_INTERVAL,
+    DESCRIPTION_MAX_AGE,
     IRRIGATION,
     LIGHT,
     OTHER,
+    PRIORITY_ALARM,
+    PRIORITY_CLIMATE,
+    PRIORITY_DEVICE,
+    PRIORITY_POLL,
     SCENARIO,
     SLEEP_AFTER_VEDO_LOGIN,
     SLEEP_BETWEEN_BRIDGE_CALLS,
-    SLEEP_BETWEEN_VEDO_CALLS,
     STATE_COVER,
+    STATE_COVER_ACTION,
     STATE_ON,
+    STATUS_CACHE_PAGES,
     VEDO,
-    WATT,
-    AlarmAreaState,
-    AlarmZoneState,
+)
+from .decoders import (
+    area_state,
+    decode_areas,
+    decode_zones,
 )
 from .exceptions import (
     CannotAuthenticate,
     CannotConnect,
     CannotRetrieveData,
+    ComelitError,
     DeviceStorageFailureError,
 )
+from .limiter import PriorityScheduler, RateLimiter
+from .models import (
+    ComelitDeviceEvent,
+    ComelitEvent,
+    ComelitSerialBridgeObject,
+    ComelitVedoAreaEvent,
+    ComelitVedoAreaObject,
+    ComelitVedoZoneEvent,
+    ComelitVedoZoneObject,
+)
+from .storage import DescriptionCache, PayloadStore
+from .units import async_parse_power
+
+
+async def _gather_or_cancel[T](aws: Iterable[Awaitable[T]]) -> list[T]:
+    """Run awaitables concurrently, cancelling the others if one fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 @dataclass
-class ComelitSerialBridgeObject:
-    """Comelit SimpleHome Serial bridge class."""
+class _ClimaCommand:
+    """Clima or humidity command waiting to be sent."""
 
-    index: int
-    name: str
-    status: int
-    human_status: str
-    type: str
-    val: int | list[list[Any]]  # Temperature or Humidity (CLIMATE)
-    protected: int
-    zone: str
-    power: float
-    power_unit: str = WATT
+    action: str
+    value: float
+    result: asyncio.Future[bool] = field(init=False)
 
 
-@dataclass
-class ComelitVedoAreaObject:
-    """Comelit SimpleHome VEDO area class."""
-
-    index: int
-    name: str
-    p1: bool
-    p2: bool
-    ready: bool
-    armed: int
-    alarm: bool
-    alarm_memory: bool
-    sabotage: bool
-    anomaly: bool
-    in_time: bool
-    out_time: bool
-    human_status: AlarmAreaState
+# Area status flags in ALARM_AREA_STATUS order
+_area_status_flags = operator.attrgetter(*ALARM_AREA_STATUS)
 
 
-@dataclass
-class ComelitVedoZoneObject:
-    """Comelit SimpleHome VEDO zone class."""
+# VEDO firmware generation detected per host, shared by all API instances
+_FIRMWARE_CACHE: dict[tuple[str, int], bool] = {}
+
+# Status cache generation per host, increased by a command from any instance
+_STATUS_GENERATIONS: dict[tuple[str, int], int] = {}
+
+# Default rate limiters per host and page type, shared by all API instances
+_RATE_LIMITERS: dict[tuple[str, int, str], RateLimiter] = {}
+
+
+def _shared_rate_limiter(host: str, port: int, host_type: str) -> RateLimiter:
+    """Return the default rate limiter of a host for a page type."""
+    key = (host, port, host_type)
+    if (limiter := _RATE_LIMITERS.get(key)) is None:
+        limiter = _RATE_LIMITERS[key] = RateLimiter(DEFAULT_RATE_LIMIT[host_type])
+    return limiter
+
 
-    index: int
-    name: str
-    status_api: str
-    status: int
-    human_status: AlarmZoneState
+# Request schedulers per host, shared by all API instances
+_SCHEDULERS: dict[tuple[str, int], PriorityScheduler] = {}
+
+
+def _shared_scheduler(host: str, port: int, max_concurrent: int) -> PriorityScheduler:
+    """Return the request scheduler of a host, with the lowest requested limit."""
+    key = (host, port)
+    if (scheduler := _SCHEDULERS.get(key)) is None:
+        scheduler = _SCHEDULERS[key] = PriorityScheduler(max_concurrent)
+    scheduler.max_concurrent = min(scheduler.max_concurrent, max_concurrent)
+    return scheduler
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    """Mark the exception of a future as retrieved if every waiter went away."""
+    if not future.cancelled():
+        future.exception()
+
+
+def _is_logged_out(reply_json: dict[str, Any]) -> bool:
+    """Return True if a JSON reply reports an expired session."""
+    return reply_json.get("logged") == 0 or reply_json.get("domus") == "000000000000"
+
+
+def _icon_desc_key(dev_type: str) -> str:
+    """Return the description cache key of a Serial bridge device type."""
+    return f"user/icon_desc.json?type={dev_type}"
 
 
 class ComelitCommonApi:
@@ -103,8 +161,54 @@ class ComelitCommonApi:
     _vedo_url_action: str
     _host_type: str
 
-    def __init__(self, host: str, port: int, pin: str, session: ClientSession) -> None:
-        """Initialize the session."""
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str,
+        port: int,
+        pin: str,
+        session: ClientSession,
+        *,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rate_limiter: RateLimiter | None = None,
+        status_cache_ttl: Mapping[str, float] | None = None,
+        description_cache_dir: Path | str | None = None,
+        new_firmware: bool | None = None,
+        concurrent_stat_fetch: bool = False,
+    ) -> None:
+        """Initialize the session.
+
+        max_concurrent_requests:
+            maximum number of requests in flight against the host at once,
+            commands are sent before polling when requests are waiting
+            (shared by all the instances of the host, the lowest limit wins)
+
+        rate_limiter:
+            pacing applied to every request, defaults to the host type limit
+            shared by all the instances of the host (VEDO pages read through
+            a Serial bridge keep the VEDO limit)
+
+        status_cache_ttl:
+            seconds a status page reply is reused, by page name
+            (see STATUS_CACHE_PAGES), disabled by default
+
+        description_cache_dir:
+            folder where description pages are kept between restarts,
+            disabled by default
+
+        new_firmware:
+            VEDO firmware generation, detected at the first login if None
+
+        concurrent_stat_fetch:
+            request the VEDO area and zone statistics pages together, paced by
+            max_concurrent_requests and rate_limiter (e.g. a burst of 2)
+
+        """
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        if status_cache_ttl and (
+            unknown := set(status_cache_ttl) - set(STATUS_CACHE_PAGES)
+        ):
+            raise ValueError(f"Status cache not supported for {sorted(unknown)}")
         self.device_pin = pin
         self.base_url = URL.build(scheme="http", host=host, port=port)
         self._headers = {
@@ -118,49 +222,300 @@ class ComelitCommonApi:
         }
         self._logging = f"{self._host_type} ({host}:{port})"
         self._session = session
-        self._json_data: list[dict[Any, Any]] = [{}, {}, {}, {}, {}]
-        self._is_new_firmware: bool = False
+        self._payloads = PayloadStore()
+        self._firmware_key = (host, port)
+        if new_firmware is None:
+            new_firmware = _FIRMWARE_CACHE.get(self._firmware_key)
+        self._is_new_firmware: bool = bool(new_firmware)
+        self._firmware_known = new_firmware is not None
+        self._scheduler = _shared_scheduler(host, port, max_concurrent_requests)
+        self._concurrent_stat_fetch = concurrent_stat_fetch
+        self._inflight_requests: dict[
+            tuple[Any, ...], asyncio.Future[tuple[int, dict[str, Any]]]
+        ] = {}
+        self._rate_limiter = rate_limiter or _shared_rate_limiter(
+            host, port, self._host_type
+        )
+        self._vedo_rate_limiter = rate_limiter or _shared_rate_limiter(host, port, VEDO)
+        self._status_cache_ttl = dict(status_cache_ttl or {})
+        self._status_cache: dict[
+            tuple[Any, ...], tuple[float, int, tuple[int, dict[str, Any]]]
+        ] = {}
+        self._host_key = (host, port)
+        self._alarm_tracker = ChangeTracker()
+        self._alarm_areas: dict[int, ComelitVedoAreaObject] = {}
+        self._logged_in: set[str] = set()
+        self._login_payloads: dict[str, dict[str, Any]] = {}
+        self._login_generation = 0
+        self._login_lock = asyncio.Lock()
+        self._login_time: datetime | None = None
+        self._description_cache = (
+            DescriptionCache(Path(description_cache_dir), host, port)
+            if description_cache_dir is not None
+            else None
+        )
+        self._description_check_pending = False
+        self._description_check_task: asyncio.Task[None] | None = None
+        if self._description_cache is not None:
+            for page in self._vedo_desc_pages:
+                if cached := self._description_cache.get(page):
+                    self._payloads.set(page, cached)
+                    self._description_check_pending = True
+
+    @property
+    def _vedo_desc_pages(self) -> tuple[str, str]:
+        """Return the VEDO area and zone description pages."""
+        return (
+            f"user/{self._vedo_url_suffix}area_desc.json",
+            f"user/{self._vedo_url_suffix}zone_desc.json",
+        )
+
+    async def _async_store_descriptions(
+        self, pages: Mapping[str, dict[str, Any]]
+    ) -> bool:
+        """Store description pages in the on-disk cache.
+
+        Return True if any of the pages changed.
+        """
+        if self._description_cache is None:
+            return False
+
+        changed = [
+            self._description_cache.set(page, data) for page, data in pages.items()
+        ]
+        if not any(changed):
+            return False
+
+        _LOGGER.debug("[%s] Saving description cache", self._logging)
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._description_cache.save
+        )
+        return True
+
+    def _schedule_description_check(self) -> None:
+        """Check the cached descriptions against the device in the background."""
+        if self._description_check_task is None or self._description_check_task.done():
+            self._description_check_task = asyncio.create_task(
+                self._async_check_descriptions()
+            )
 
-    async def _get_page_result(
+    async def _async_check_descriptions(self) -> None:
+        """Reload the description pages, retried on the next poll on errors."""
+        try:
+            await self._async_refresh_descriptions()
+        except ComelitError as exc:
+            _LOGGER.debug(
+                "[%s] Checking cached descriptions failed: %s", self._logging, exc
+            )
+            return
+
+        self._description_check_pending = False
+
+    async def _async_refresh_descriptions(self) -> None:
+        """Download the VEDO description pages and update the cache."""
+        area_page, zone_page = self._vedo_desc_pages
+        checks: list[tuple[str, str | int]] = [(area_page, 1), (zone_page, "1")]
+        pages: dict[str, dict[str, Any]] = {}
+        for page, present in checks:
+            reply_status, reply_json = await self._async_get_page_data(
+                "cached description check", page, present
+            )
+            if not reply_status:
+                raise CannotRetrieveData("Login expired checking cached descriptions")
+            self._payloads.set(page, reply_json)
+            pages[page] = reply_json
+
+        await self._async_store_descriptions(pages)
+
+    async def _get_page_result(  # noqa: PLR0913
         self,
         page: str,
         query: dict[str, Any] | None = None,
         reply_json: bool = True,
         ignore_missing: bool = False,
+        *,
+        retry_login: bool = True,
+        priority: int = PRIORITY_POLL,
+    ) -> tuple[int, dict[str, Any]]:
+        """Return status and data from a GET query.
+
+        Concurrent identical queries share a single request and its decoded
+        result, so callers must not modify the returned data.
+        Status pages can also be served from a short-lived cache.
+        Queries without a JSON reply are commands and are always sent,
+        ahead of the queries with a lower priority (higher value).
+        A JSON reply reporting an expired session triggers a new login
+        and the query is sent once more.
+        """
+        if not reply_json:
+            return await self._fetch_page_result(
+                page, query, reply_json, ignore_missing, priority
+            )
+
+        login_generation = self._login_generation
+        result = await self._get_json_page_result(page, query, ignore_missing)
+        if not retry_login or not self._is_reply_logged_out(result[1]):
+            return result
+
+        self._logged_in.clear()
+        if not await self._relogin(login_generation):
+            return result
+
+        _LOGGER.debug("[%s] Retrying GET for %s after login", self._logging, page)
+        result = await self._get_json_page_result(page, query, ignore_missing)
+        if self._is_reply_logged_out(result[1]):
+            self._logged_in.clear()
+        return result
+
+    def _is_reply_logged_out(self, reply_json: dict[str, Any]) -> bool:
+        """Return True if a JSON reply reports an expired session.
+
+        Serial bridge device pages carry no login state, an expired session
+        gets an empty reply.
+        """
+        return _is_logged_out(reply_json) or (
+            self._host_type == BRIDGE and not reply_json
+        )
+
+    async def _get_json_page_result(
+        self,
+        page: str,
+        query: dict[str, Any] | None,
+        ignore_missing: bool,
     ) -> tuple[int, dict[str, Any]]:
-        """Return status and data from a GET query."""
+        """Return status and data from a shared or cached GET query."""
+        key = (page, tuple(sorted((query or {}).items())), ignore_missing)
+        loop = asyncio.get_running_loop()
+        if (
+            (cached := self._status_cache.get(key))
+            and cached[0] > loop.time()
+            and cached[1] == self._status_cache_generation
+        ):
+            _LOGGER.debug("[%s] GET page %s served from cache", self._logging, page)
+            return cached[2]
+
+        generation = self._status_cache_generation
+        if (task := self._inflight_requests.get(key)) is None:
+            task = asyncio.ensure_future(
+                self._fetch_page_result(page, query, True, ignore_missing)
+            )
+            self._inflight_requests[key] = task
+            task.add_done_callback(functools.partial(self._inflight_done, key))
+        else:
+            _LOGGER.debug("[%s] Joining in-flight GET for %s", self._logging, page)
+
+        result = await asyncio.shield(task)
+
+        # Don't cache replies requested before a command changed the state
+        if (
+            (
+                ttl := self._status_cache_ttl.get(
+                    page.rsplit("/", 1)[-1].removeprefix(self._vedo_url_suffix)
+                )
+            )
+            and generation == self._status_cache_generation
+            and not self._is_reply_logged_out(result[1])
+        ):
+            self._status_cache[key] = (loop.time() + ttl, generation, result)
+
+        return result
+
+    async def _relogin(self, login_generation: int) -> bool:
+        """Login again with the stored credentials after a session expired.
+
+        Callers that saw the session expire at the same time share a
+        single login: nothing is sent if a login happened since
+        login_generation was read.
+        """
+        if not self._login_payloads:
+            return False
+
+        async with self._login_lock:
+            if login_generation != self._login_generation:
+                return True
+            _LOGGER.debug("[%s] Session expired, logging in again", self._logging)
+            for host_type, payload in list(self._login_payloads.items()):
+                await self._login(payload, host_type, verify=False)
+        return True
+
+    @property
+    def _status_cache_generation(self) -> int:
+        """Return the status cache generation of the host."""
+        return _STATUS_GENERATIONS.get(self._host_key, 0)
+
+    def _invalidate_status_cache(self) -> None:
+        """Drop cached status pages after a command changed the device state.
+
+        The cached pages of the other instances of the host are dropped too.
+        """
+        self._status_cache.clear()
+        _STATUS_GENERATIONS[self._host_key] = self._status_cache_generation + 1
+
+    def invalidate_descriptions(self) -> None:
+        """Drop the VEDO description pages, downloaded again on the next poll."""
+        self._payloads.invalidate(*self._vedo_desc_pages)
+        if self._description_cache is not None:
+            self._description_cache.invalidate(*self._vedo_desc_pages)
+        self._description_check_pending = False
+
+    def _inflight_done(
+        self,
+        key: tuple[Any, ...],
+        task: asyncio.Future[tuple[int, dict[str, Any]]],
+    ) -> None:
+        """Forget a completed in-flight GET."""
+        self._inflight_requests.pop(key, None)
+        # Mark the exception as retrieved if every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_page_result(
+        self,
+        page: str,
+        query: dict[str, Any] | None,
+        reply_json: bool,
+        ignore_missing: bool,
+        priority: int = PRIORITY_POLL,
+    ) -> tuple[int, dict[str, Any]]:
+        """Send a GET query and return status and data."""
         url = URL.joinpath(self.base_url, page)
         url = URL.extend_query(url, query)
         url = URL.extend_query(url, {"_": int(datetime.now(tz=UTC).timestamp() * 1000)})
         _LOGGER.debug("[%s] GET page %s", self._logging, url)
+        limiter = self._page_rate_limiter(page)
         try:
-            response = await self._session.get(
-                url,
-                headers=self._headers,
-                timeout=DEFAULT_TIMEOUT,
-            )
+            async with self._scheduler.slot(priority):
+                await limiter.acquire()
+                start = asyncio.get_running_loop().time()
+                response = await self._session.get(
+                    url,
+                    headers=self._headers,
+                    timeout=DEFAULT_TIMEOUT,
+                )
+                body = await response.read()
         except (TimeoutError, ClientConnectorError) as exc:
+            limiter.record_failure()
             raise CannotConnect("Connection error during GET") from exc
 
-        _LOGGER.debug(
-            "[%s] GET response %s",
-            self._logging,
-            await response.text(),
-        )
+        self._log_response_body("GET", body)
 
         if response.status == HTTPStatus.NOT_FOUND and ignore_missing:
-            return response.status, {"page": await response.text()}
+            self._record_response_time(limiter, start)
+            return response.status, {"page": body.decode(errors="replace")}
 
         if response.status != HTTPStatus.OK:
+            limiter.record_failure()
             raise CannotRetrieveData(f"GET response status {response.status}")
 
+        self._record_response_time(limiter, start)
+
         if not reply_json:
             _LOGGER.debug("[%s] GET response is empty", self._logging)
             return response.status, {}
 
         try:
-            json_data = await response.json(loads=orjson.loads)
-        except (orjson.JSONDecodeError, ContentTypeError) as exc:
+            json_data = orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
             raise DeviceStorageFailureError("Error parsing JSON response") from exc
 
         return response.status, json_data
@@ -170,30 +525,68 @@ class ComelitCommonApi:
         page: str,
         payload: dict[str, Any],
         ignore_missing: bool = False,
+        *,
+        priority: int = PRIORITY_POLL,
     ) -> tuple[int, SimpleCookie]:
         """Return status and cookies from a POST query."""
         url = URL.joinpath(self.base_url, page)
         _LOGGER.debug("[%s] POST page %s with payload %s", self._logging, url, payload)
+        limiter = self._page_rate_limiter(page)
         try:
-            response = await self._session.post(
-                url,
-                data=payload,
-                headers=self._headers,
-                timeout=DEFAULT_TIMEOUT,
-            )
+            async with self._scheduler.slot(priority):
+                await limiter.acquire()
+                start = asyncio.get_running_loop().time()
+                response = await self._session.post(
+                    url,
+                    data=payload,
+                    headers=self._headers,
+                    timeout=DEFAULT_TIMEOUT,
+                )
+                body = await response.read()
         except (TimeoutError, ClientConnectorError) as exc:
+            limiter.record_failure()
             raise CannotConnect("Connection error during POST") from exc
 
-        _LOGGER.debug("[%s] POST response %s", self._logging, await response.text())
+        self._log_response_body("POST", body)
 
         if response.status == HTTPStatus.NOT_FOUND and ignore_missing:
+            self._record_response_time(limiter, start)
             return response.status, SimpleCookie()
 
         if response.status != HTTPStatus.OK:
+            limiter.record_failure()
             raise CannotRetrieveData(f"POST response status {response.status}")
 
+        self._record_response_time(limiter, start)
         return response.status, cast("SimpleCookie", response.cookies)
 
+    @property
+    def _vedo_pages_rate_limiter(self) -> RateLimiter:
+        """Return the rate limiter pacing VEDO pages."""
+        if self._host_type == BRIDGE:
+            return self._vedo_rate_limiter
+        return self._rate_limiter
+
+    def _page_rate_limiter(self, page: str) -> RateLimiter:
+        """Return the rate limiter pacing requests for a page."""
+        if page.rsplit("/", 1)[-1].startswith(self._vedo_url_suffix):
+            return self._vedo_pages_rate_limiter
+        return self._rate_limiter
+
+    def _record_response_time(self, limiter: RateLimiter, start: float) -> None:
+        """Feed the response time of a successful request to the rate limiter."""
+        limiter.record_success(asyncio.get_running_loop().time() - start)
+
+    def _log_response_body(self, method: str, body: bytes) -> None:
+        """Log a response body, decoding it only when debug logging is enabled."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[%s] %s response %s",
+                self._logging,
+                method,
+                body.decode(errors="replace"),
+            )
+
     async def _is_session_active(self) -> bool:
         """Check if aiohttp session is still active."""
         return hasattr(self, "_session") and not self._session.closed
@@ -202,14 +595,14 @@ class ComelitCommonApi:
         """Check if login is active."""
         logged: bool
         if host_type == BRIDGE:
-            _, reply_json = await self._get_page_result("login.json")
+            _, reply_json = await self._get_page_result("login.json", retry_login=False)
             _LOGGER.debug("[%s] Login reply: %s", self._logging, reply_json)
             logged = reply_json["domus"] != "000000000000"
         else:
             # For VEDO system with newer firmware, login.json is reporting logged=0
             # even if the session is active, so we check the area_stat.json instead
             _, reply_json = await self._get_page_result(
-                f"user/{self._vedo_url_suffix}area_stat.json"
+                f"user/{self._vedo_url_suffix}area_stat.json", retry_login=False
             )
             _LOGGER.debug("[%s] Login reply: %s", self._logging, reply_json)
             logged = reply_json["logged"] == 1
@@ -234,25 +627,57 @@ class ComelitCommonApi:
         _LOGGER.debug("[%s] New firmware: %s", self._logging, status)
         return status
 
+    async def _async_update_firmware(self) -> bool:
+        """Detect the VEDO firmware and return True if it changed."""
+        new_firmware = await self._check_new_firmware()
+        changed = new_firmware != self._is_new_firmware
+        self._is_new_firmware = new_firmware
+        self._firmware_known = True
+        _FIRMWARE_CACHE[self._firmware_key] = new_firmware
+        return changed
+
     @abstractmethod
     async def login(self) -> bool:
         """Login to Comelit device."""
 
-    async def _login(self, payload: dict[str, Any], host_type: str) -> bool:
-        """Login into Comelit device."""
-        _LOGGER.debug("[%s] Logging in", self._logging)
+    async def _login(
+        self,
+        payload: dict[str, Any],
+        host_type: str,
+        verify: bool = True,
+    ) -> bool:
+        """Login into Comelit device.
 
-        if await self._check_logged_in(host_type):
-            return True
+        Nothing is sent while a VEDO session is known to be active, an
+        expired session is detected from the replies and renewed on demand.
+        A Serial bridge session is checked with a single login.json query.
+
+        verify:
+            check the session with an extra query after sending credentials
+
+        """
+        self._login_payloads[host_type] = payload
+        if host_type in self._logged_in:
+            # Serial bridge pages don't report the login state, check it
+            if host_type != BRIDGE or await self._check_logged_in(host_type):
+                return True
+            _LOGGER.debug("[%s] Session expired", self._logging)
+            self._logged_in.discard(host_type)
 
-        _, cookies = await self._post_page_result("login.cgi", payload)
+        _LOGGER.debug("[%s] Logging in", self._logging)
+        self._invalidate_status_cache()
+
+        _, cookies = await self._post_page_result(
+            "login.cgi", payload, priority=PRIORITY_ALARM
+        )
         _LOGGER.debug("[%s] Cookies: %s", self._logging, cookies)
 
         if host_type == VEDO:
             _LOGGER.debug("[%s] Waiting for login to complete", self._logging)
-            await self._sleep_between_call(SLEEP_AFTER_VEDO_LOGIN)
+            self._vedo_pages_rate_limiter.pause(SLEEP_AFTER_VEDO_LOGIN)
 
-            self._is_new_firmware = await self._check_new_firmware()
+            if not self._firmware_known:
+                await self._async_update_firmware()
 
         if not cookies:
             _LOGGER.warning(
@@ -261,83 +686,92 @@ class ComelitCommonApi:
             raise CannotAuthenticate
 
         self._session.cookie_jar.update_cookies(cookies, self.base_url)
+        self._login_generation += 1
+        self._login_time = datetime.now(tz=UTC)
 
-        return await self._check_logged_in(host_type)
+        if verify and not await self._check_logged_in(host_type):
+            return False
 
-    async def logout(self) -> None:
-        """Comelit Simple Home logout."""
-        if await self._is_session_active():
-            payload = {"logout": 1}
-            await self._post_page_result("login.cgi", payload)
-            self._session.cookie_jar.clear()
+        self._logged_in.add(host_type)
+        return True
 
-    async def _translate_zone_status(
-        self,
-        zone: ComelitVedoZoneObject,
-    ) -> AlarmZoneState:
-        """Translate ZONE status."""
-        for status in ALARM_ZONE_STATUS:
-            if zone.status & status != 0:
-                return ALARM_ZONE_STATUS[status]
+    def export_session(self) -> dict[str, Any]:
+        """Return the session state as JSON serializable data.
 
-        return AlarmZoneState.REST
+        The data can be stored and given to import_session after a restart,
+        to reuse a still valid session instead of logging in again.
+        """
+        cookies = self._session.cookie_jar.filter_cookies(self.base_url)
+        return {
+            "host": self.base_url.host,
+            "port": self.base_url.port,
+            "cookies": {name: morsel.value for name, morsel in cookies.items()},
+            "logged_in": sorted(self._logged_in),
+            "login_time": self._login_time.isoformat() if self._login_time else None,
+            "new_firmware": self._is_new_firmware,
+        }
 
-    async def _translate_area_status(
+    def import_session(
         self,
-        area: ComelitVedoAreaObject,
-    ) -> AlarmAreaState:
-        """Translate AREA status."""
-        for field in ALARM_AREA_STATUS:
-            if getattr(area, field):
-                return ALARM_AREA_STATUS[field]
+        data: Mapping[str, Any],
+        max_age: float | None = None,
+    ) -> bool:
+        """Restore a session state returned by export_session.
 
-        return AlarmAreaState.DISARMED
+        On VEDO the next login() sends nothing, if the session has expired
+        in the meantime it is renewed at the first request. A Serial bridge
+        login() still checks the session with a login.json request.
 
-    async def _create_area_object(
-        self,
-        json_area_desc: dict[str, Any],
-        json_area_stat: dict[str, Any],
-        index: int,
-    ) -> ComelitVedoAreaObject:
-        """Get area status."""
-        area = ComelitVedoAreaObject(
-            index=index,
-            name=json_area_desc["description"][index],
-            p1=json_area_desc["p1_pres"][index],
-            p2=json_area_desc["p2_pres"][index],
-            ready=json_area_stat["ready"][index],
-            armed=json_area_stat["armed"][index],
-            alarm=json_area_stat["alarm"][index],
-            alarm_memory=json_area_stat["alarm_memory"][index],
-            sabotage=json_area_stat["sabotage"][index],
-            anomaly=json_area_stat["anomaly"][index],
-            in_time=json_area_stat["in_time"][index],
-            out_time=json_area_stat["out_time"][index],
-            human_status=AlarmAreaState.UNKNOWN,
-        )
-        area.human_status = await self._translate_area_status(area)
-        _LOGGER.debug("[%s] Area: %s", self._logging, area)
-        return area
-
-    async def _create_zone_object(
-        self,
-        json_zone_desc: dict[str, Any],
-        json_zone_stat: dict[str, Any],
-        index: int,
-    ) -> ComelitVedoZoneObject:
-        """Create zone object."""
-        status_api = json_zone_stat["status"].split(",")[index]
+        max_age:
+            ignore sessions older than this number of seconds
+
+        Return False if the session belongs to another host, has no login
+        or is too old.
+        """
+        if (data.get("host"), data.get("port")) != (
+            self.base_url.host,
+            self.base_url.port,
+        ):
+            _LOGGER.debug("[%s] Ignoring session of another host", self._logging)
+            return False
+
+        if not data.get("cookies") or not data.get("logged_in"):
+            return False
 
-        zone = ComelitVedoZoneObject(
-            index=index,
-            name=json_zone_desc["description"][index],
-            status=int(status_api, 16),
-            status_api=status_api,
-            human_status=AlarmZoneState.UNKNOWN,
+        login_time = (
+            datetime.fromisoformat(data["login_time"])
+            if data.get("login_time")
+            else None
         )
-        zone.human_status = await self._translate_zone_status(zone)
-        _LOGGER.debug("[%s] Zone: %s", self._logging, zone)
-        return zone
+        if max_age is not None and (
+            login_time is None
+            or (datetime.now(tz=UTC) - login_time).total_seconds() > max_age
+        ):
+            _LOGGER.debug("[%s] Ignoring expired session", self._logging)
+            return False
+
+        self._session.cookie_jar.update_cookies(data["cookies"], self.base_url)
+        self._logged_in = set(data["logged_in"])
+        self._login_time = login_time
+        if (new_firmware := data.get("new_firmware")) is not None:
+            self._is_new_firmware = bool(new_firmware)
+            self._firmware_known = True
+            _FIRMWARE_CACHE[self._firmware_key] = self._is_new_firmware
+        self._invalidate_status_cache()
+        _LOGGER.debug("[%s] Session restored", self._logging)
+        return True
+
+    async def logout(self) -> None:
+        """Comelit Simple Home logout."""
+        if self._description_check_task is not None:
+            self._description_check_task.cancel()
+        self._logged_in.clear()
+        self._login_payloads.clear()
+        self._login_time = None
+        if await self._is_session_active():
+            payload = {"logout": 1}
+            await self._post_page_result("login.cgi", payload)
+            self._session.cookie_jar.clear()
 
     async def _async_get_page_data(
         self,
@@ -372,6 +806,34 @@ class ComelitCommonApi:
             True  = force action
 
         """
+        try:
+            success = await self._send_zone_action(index, action, force)
+        except CannotRetrieveData:
+            # The firmware may have been updated since it was detected
+            if not await self._async_update_firmware():
+                raise
+            _LOGGER.debug("[%s] Retrying zone action", self._logging)
+            success = await self._send_zone_action(index, action, force)
+
+        if success:
+            self._invalidate_status_cache()
+            self._set_optimistic_area_status(index, action)
+        return success
+
+    def _set_optimistic_area_status(self, index: int, action: str) -> None:
+        """Update the known areas with the state expected after an action."""
+        if (armed := ALARM_ACTION_ARMED.get(action)) is None:
+            return
+
+        for area in self._alarm_areas.values():
+            if index not in (area.index, ALARM_ALL_AREAS):
+                continue
+            area.armed = armed
+            area.human_status = area_state(_area_status_flags(area))
+            area.confirmed = False
+
+    async def _send_zone_action(self, index: int, action: str, force: bool) -> bool:
+        """Send a zone action with the protocol of the detected firmware."""
         if self._is_new_firmware:
             # New firmware uses HTTP POST requests with payload parameters.
             # The device always returns HTTP 404, even when the action succeeds.
@@ -384,139 +846,192 @@ class ComelitCommonApi:
                     "area_param": index,
                 },
                 ignore_missing=True,
+                priority=PRIORITY_ALARM,
+            )
+            success = reply_status in (HTTPStatus.OK, HTTPStatus.NOT_FOUND)
+        else:
+            # Previous firmware uses HTTP GET requests with query parameters
+            reply_status, _ = await self._get_page_result(
+                page=self._vedo_url_action,
+                query={
+                    "vedo": 1,
+                    action: index,
+                    "force": int(force),
+                },
+                reply_json=False,
+                priority=PRIORITY_ALARM,
             )
-            return reply_status in (HTTPStatus.OK, HTTPStatus.NOT_FOUND)
+            success = reply_status == HTTPStatus.OK
 
-        # Previous firmware uses HTTP GET requests with query parameters
-        reply_status, _ = await self._get_page_result(
-            page=self._vedo_url_action,
-            query={
-                "vedo": 1,
-                action: index,
-                "force": int(force),
-            },
-            reply_json=False,
+        return success
+
+    async def _async_get_vedo_page(
+        self,
+        desc: str,
+        page: str,
+        present_check: str | int | None = None,
+    ) -> dict[str, Any]:
+        """Download a VEDO page and store it.
+
+        An expired session is renewed by _get_page_result, the page is
+        not available if the reply still reports it.
+        """
+        reply_status, reply_json = await self._async_get_page_data(
+            desc,
+            page,
+            present_check,
         )
-        return reply_status == HTTPStatus.OK
+        if not reply_status:
+            raise CannotRetrieveData(f"Login expired or {desc} not available")
+        self._payloads.set(page, reply_json)
+        return reply_json
 
     async def get_area_status(
         self,
         area: ComelitVedoAreaObject,
     ) -> ComelitVedoAreaObject:
         """Get AREA status."""
-        _, reply_json_area_stat = await self._async_get_page_data(
-            desc="AREA statistics",
-            page=f"user/{self._vedo_url_suffix}area_stat.json",
-        )
-        description = {
-            "description": [area.name],
-            "p1_pres": [area.p1],
-            "p2_pres": [area.p2],
-        }
+        areas = await self.get_areas_status([area.index])
+        if (updated := areas.get(area.index)) is None:
+            raise CannotRetrieveData(f"AREA {area.index} not available")
+        return updated
 
-        return await self._create_area_object(
-            description,
-            reply_json_area_stat,
-            area.index,
+    async def get_areas_status(
+        self,
+        indexes: Iterable[int] | None = None,
+    ) -> dict[int, ComelitVedoAreaObject]:
+        """Get the status of the given AREA indexes, or of all areas.
+
+        A single area_stat page is downloaded for all the areas, the area
+        descriptions are reused once retrieved.
+        """
+        if self._description_check_pending:
+            self._schedule_description_check()
+
+        area_desc, _ = self._vedo_desc_pages
+        if area_desc not in self._payloads:
+            reply_json = await self._async_get_vedo_page(
+                "AREA description", area_desc, 1
+            )
+            await self._async_store_descriptions({area_desc: reply_json})
+        json_area_stat = await self._async_get_vedo_page(
+            "AREA statistics",
+            f"user/{self._vedo_url_suffix}area_stat.json",
         )
 
+        areas = decode_areas(self._payloads.get(area_desc), json_area_stat)
+        if indexes is not None:
+            areas = {index: areas[index] for index in indexes if index in areas}
+        _LOGGER.debug("[%s] Areas: %s", self._logging, areas)
+
+        # Update the known areas in place, callers may hold them
+        for index, area in areas.items():
+            if (known := self._alarm_areas.get(index)) is None:
+                self._alarm_areas[index] = area
+                continue
+            for attr in fields(area):
+                setattr(known, attr.name, getattr(area, attr.name))
+            areas[index] = known
+        return areas
+
     async def get_all_areas_and_zones(
         self,
     ) -> dict[str, Mapping[int, ComelitVedoAreaObject | ComelitVedoZoneObject]]:
-        """Get all VEDO system AREA and ZONE."""
-        queries: dict[int, dict[str, Any]] = {
-            1: {
-                "desc": "AREA description",
-                "page": f"user/{self._vedo_url_suffix}area_desc.json",
-                "present": 1,
-            },
-            2: {
-                "desc": "ZONE description",
-                "page": f"user/{self._vedo_url_suffix}zone_desc.json",
-                "present": "1",
-            },
-            3: {
-                "desc": "AREA statistics",
-                "page": f"user/{self._vedo_url_suffix}area_stat.json",
-                "present": None,
-            },
-            4: {
-                "desc": "ZONE statistics",
-                "page": f"user/{self._vedo_url_suffix}zone_stat.json",
-                "present": None,
-            },
+        """Get all VEDO system AREA and ZONE.
+
+        Description pages loaded from the on-disk cache are used at once
+        and checked against the device in the background. The statistics
+        pages are requested together if concurrent_stat_fetch is enabled.
+        """
+        if self._description_check_pending:
+            self._schedule_description_check()
+
+        area_desc, zone_desc = self._vedo_desc_pages
+        area_stat = f"user/{self._vedo_url_suffix}area_stat.json"
+        zone_stat = f"user/{self._vedo_url_suffix}zone_stat.json"
+        desc_queries: dict[str, tuple[str, str | int]] = {
+            area_desc: ("AREA description", 1),
+            zone_desc: ("ZONE description", "1"),
         }
 
-        for index, info in queries.items():
-            desc = info["desc"]
-            page = info["page"]
-            present = info["present"]
-            if "_desc" in page and self._json_data[index]:
+        descriptions: dict[str, dict[str, Any]] = {}
+        for page, (desc, present) in desc_queries.items():
+            if page in self._payloads:
                 _LOGGER.debug(
                     "[%s] Data for %s already retrieved, skipping", self._logging, desc
                 )
                 continue
-            await self._sleep_between_call(SLEEP_BETWEEN_VEDO_CALLS)
-            reply_status, reply_json = await self._async_get_page_data(
-                desc,
-                page,
-                present,
-            )
-            if not reply_status:
-                _LOGGER.debug(
-                    "[%s] Login expired accessing %s, re-login attempt",
-                    self._logging,
-                    desc,
-                )
-                await self.login()
-                await self._sleep_between_call(SLEEP_BETWEEN_VEDO_CALLS)
-                reply_status, reply_json = await self._async_get_page_data(
-                    desc,
-                    page,
-                    present,
-                )
-                if not reply_status:
-                    raise CannotRetrieveData(
-                        "Login expired and not working after a retry",
-                    )
-                _LOGGER.debug("[%s] Re-login successful", self._logging)
-            self._json_data.insert(index, reply_json)
+            descriptions[page] = await self._async_get_vedo_page(desc, page, present)
 
-        list_areas: list[int] = self._json_data[1]["present"]
-        areas: dict[int, ComelitVedoAreaObject] = {}
-        for i in range(len(list_areas)):
-            if not list_areas[i]:
-                _LOGGER.debug(
-                    "[%s] Alarm skipping non present AREA [%i]", self._logging, i
-                )
-                continue
-            area = await self._create_area_object(
-                self._json_data[1],
-                self._json_data[3],
-                i,
-            )
-            areas.update({i: area})
+        await self._async_store_descriptions(descriptions)
 
-        list_zones: list[int] = self._json_data[2]["present"]
-        zones: dict[int, ComelitVedoZoneObject] = {}
-        for i in range(len(list_zones)):
-            if not int(list_zones[i]):
-                _LOGGER.debug(
-                    "[%s] Alarm skipping non present ZONE [%i]", self._logging, i
-                )
-                continue
-            zone = await self._create_zone_object(
-                self._json_data[2],
-                self._json_data[4],
-                i,
+        stat_queries = {area_stat: "AREA statistics", zone_stat: "ZONE statistics"}
+        if self._concurrent_stat_fetch:
+            await _gather_or_cancel(
+                self._async_get_vedo_page(desc, page)
+                for page, desc in stat_queries.items()
             )
-            zones.update({i: zone})
+        else:
+            for page, desc in stat_queries.items():
+                await self._async_get_vedo_page(desc, page)
+
+        areas = decode_areas(
+            self._payloads.get(area_desc), self._payloads.get(area_stat)
+        )
+        _LOGGER.debug("[%s] Areas: %s", self._logging, areas)
+        zones = decode_zones(
+            self._payloads.get(zone_desc), self._payloads.get(zone_stat)
+        )
+        _LOGGER.debug("[%s] Zones: %s", self._logging, zones)
 
+        self._alarm_areas = areas
         return {
             ALARM_AREA: areas,
             ALARM_ZONE: zones,
         }
 
+    async def get_changed_areas_and_zones(
+        self,
+    ) -> dict[str, dict[int, ComelitVedoAreaObject | ComelitVedoZoneObject]]:
+        """Get VEDO AREA and ZONE whose state changed since the previous call.
+
+        The first call returns every AREA and ZONE.
+        """
+        return self._alarm_tracker.update(await self.get_all_areas_and_zones())
+
+    async def _async_poll_events(self) -> list[ComelitEvent]:
+        """Poll the device once and return the state changes."""
+        changes = await self.get_changed_areas_and_zones()
+        events: list[ComelitEvent] = [
+            ComelitVedoAreaEvent(area)
+            for area in changes.get(ALARM_AREA, {}).values()
+            if isinstance(area, ComelitVedoAreaObject)
+        ]
+        events.extend(
+            ComelitVedoZoneEvent(zone)
+            for zone in changes.get(ALARM_ZONE, {}).values()
+            if isinstance(zone, ComelitVedoZoneObject)
+        )
+        return events
+
+    async def watch(
+        self,
+        interval: float = DEFAULT_WATCH_INTERVAL,
+    ) -> AsyncGenerator[ComelitEvent]:
+        """Poll the device on a schedule and yield state changes.
+
+        The first poll reports the current state of everything. A new poll
+        only starts once the consumer has taken every event of the previous
+        one, so a slow consumer delays polling instead of overlapping it.
+        Errors raised by a poll end the iteration.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            for event in await self._async_poll_events():
+                yield event
+            await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
 
 class ComeliteSerialBridgeApi(ComelitCommonApi):
     """Queries Comelit SimpleHome Serial bridge."""
@@ -525,15 +1040,42 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
     _vedo_url_action: str = "user/action.cgi"
     _host_type = BRIDGE
 
-    def __init__(
-        self, host: str, port: int, bridge_pin: str, session: ClientSession
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str,
+        port: int,
+        bridge_pin: str,
+        session: ClientSession,
+        *,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rate_limiter: RateLimiter | None = None,
+        status_cache_ttl: Mapping[str, float] | None = None,
+        description_cache_dir: Path | str | None = None,
+        new_firmware: bool | None = None,
+        concurrent_stat_fetch: bool = False,
     ) -> None:
         """Initialize the session."""
-        super().__init__(host, port, bridge_pin, session)
+        super().__init__(
+            host,
+            port,
+            bridge_pin,
+            session,
+            max_concurrent_requests=max_concurrent_requests,
+            rate_limiter=rate_limiter,
+            status_cache_ttl=status_cache_ttl,
+            description_cache_dir=description_cache_dir,
+            new_firmware=new_firmware,
+            concurrent_stat_fetch=concurrent_stat_fetch,
+        )
         self._devices: dict[str, dict[int, ComelitSerialBridgeObject]] = {}
         self._last_clima_command: datetime | None = None
         self._semaphore = asyncio.Semaphore()
+        self._pending_clima_commands: dict[tuple[int, str], _ClimaCommand] = {}
         self._initialized = False
+        self._last_description_update: datetime | None = None
+        self._device_tracker = ChangeTracker()
+        self._devices_from_cache = False
+        self._vedo_enabled = False
 
     async def _translate_device_status(self, dev_type: str, dev_status: int) -> str:
         """Make status human readable."""
@@ -554,8 +1096,72 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
         action:
             auto, man, on, off, set
 
+        A command waiting to be sent is replaced by a newer one with the
+        same index, mode and action: only the latest value is sent and
+        every caller gets its result. The command is sent by its own task,
+        so a cancelled caller doesn't cancel it for the others.
         """
-        await self._semaphore.acquire()
+        key = (index, mode)
+        if (pending := self._pending_clima_commands.get(key)) and (
+            pending.action == action
+        ):
+            _LOGGER.debug(
+                "[%s] Replacing pending %s command for %s[%s]",
+                self._logging,
+                action,
+                mode,
+                index,
+            )
+            pending.value = value
+            return await asyncio.shield(pending.result)
+
+        command = _ClimaCommand(action, value)
+        command.result = asyncio.create_task(
+            self._async_send_clima_command(key, index, mode, command)
+        )
+        command.result.add_done_callback(_retrieve_exception)
+        self._pending_clima_commands[key] = command
+        return await asyncio.shield(command.result)
+
+    async def _async_send_clima_command(
+        self,
+        key: tuple[int, str],
+        index: int,
+        mode: str,
+        command: _ClimaCommand,
+    ) -> bool:
+        """Send a queued clima or humidity command with its latest value."""
+        try:
+            async with self._semaphore:
+                await self._wait_between_clima_commands()
+                # Newer values merge in until the command is actually sent
+                if self._pending_clima_commands.get(key) is command:
+                    del self._pending_clima_commands[key]
+                success = await self._send_thermo_humi_command(
+                    index, mode, command.action, command.value
+                )
+        finally:
+            if self._pending_clima_commands.get(key) is command:
+                del self._pending_clima_commands[key]
+
+        if success and command.action == CLIMATE_SET:
+            self._set_optimistic_set_point(index, mode, command.value)
+        return success
+
+    def _set_optimistic_set_point(self, index: int, mode: str, value: float) -> None:
+        """Update a known climate with the set-point expected after a command."""
+        device = self._devices.get(CLIMATE, {}).get(index)
+        if device is None or not isinstance(device.val, list):
+            return
+
+        # Copy, the values may be shared with cached replies
+        val = copy.deepcopy(device.val)
+        val[CLIMATE_MODES.index(mode)][CLIMATE_SET_POINT] = int(value * 10)
+        device.val = val
+        device.confirmed = False
+
+    async def _wait_between_clima_commands(self) -> None:
+        """Wait until the previous clima or humidity command is far enough."""
         if self._last_clima_command:
             delta_seconds = SLEEP_BETWEEN_BRIDGE_CALLS - round(
                 (datetime.now(tz=UTC) - self._last_clima_command).total_seconds(),
@@ -569,6 +1175,14 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
                 )
                 await self._sleep_between_call(delta_seconds)
 
+    async def _send_thermo_humi_command(
+        self,
+        index: int,
+        mode: str,
+        action: str,
+        value: float,
+    ) -> bool:
+        """Send a clima or humidity command."""
         reply_status, _ = await self._get_page_result(
             page="user/action.cgi",
             query={
@@ -577,10 +1191,14 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
                 "val": int(value * 10),
             },
             reply_json=False,
+            priority=PRIORITY_CLIMATE,
         )
         self._last_clima_command = datetime.now(tz=UTC)
-        self._semaphore.release()
-        return reply_status == HTTPStatus.OK
+        if reply_status != HTTPStatus.OK:
+            return False
+
+        self._invalidate_status_cache()
+        return True
 
     async def set_clima_status(self, index: int, action: str, temp: float = 0) -> bool:
         """Set clima status."""
@@ -615,8 +1233,68 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
                 f"num{action}": index,
             },
             reply_json=False,
+            priority=PRIORITY_DEVICE,
         )
-        return reply_status == HTTPStatus.OK
+        if reply_status != HTTPStatus.OK:
+            return False
+
+        self._invalidate_status_cache()
+        device = self._devices.get(device_type, {}).get(index)
+        if device is None:
+            return True
+        if device_type == COVER:
+            # A command may stop a moving cover, wait for the next poll
+            if device.status != STATE_COVER.index("stopped"):
+                return True
+            device.status = STATE_COVER_ACTION[action]
+        else:
+            device.status = action
+        device.human_status = await self._translate_device_status(
+            device_type, device.status
+        )
+        device.confirmed = False
+        return True
+
+    async def set_devices_status(
+        self,
+        device_type: str,
+        actions: Mapping[int, int],
+    ) -> dict[int, bool]:
+        """Set the action of many devices of the same type.
+
+        actions:
+            device index -> action (see set_device_status)
+
+        Commands are sent one at a time, each after the previous reply.
+        A rejected command doesn't stop the batch, but if the bridge can't
+        be reached the remaining commands are reported as failed unsent.
+        """
+        results: dict[int, bool] = {}
+        for index, action in actions.items():
+            try:
+                results[index] = await self.set_device_status(
+                    device_type, index, action
+                )
+            except CannotRetrieveData as exc:
+                _LOGGER.debug(
+                    "[%s] Device %s[%s] action failed: %s",
+                    self._logging,
+                    device_type,
+                    index,
+                    exc,
+                )
+                results[index] = False
+            except CannotConnect as exc:
+                _LOGGER.debug(
+                    "[%s] Device %s[%s] action failed, stopping: %s",
+                    self._logging,
+                    device_type,
+                    index,
+                    exc,
+                )
+                break
+
+        return {index: results.get(index, False) for index in actions}
 
     async def get_device_status(self, device_type: str, index: int) -> int:
         """Get device status."""
@@ -633,44 +1311,198 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
         )
         return cast("int", reply_json["status"][index])
 
+    async def get_devices_status(
+        self,
+        devices: Mapping[str, Iterable[int] | None],
+    ) -> dict[str, dict[int, int]]:
+        """Get the status of many devices with one request per device type.
+
+        devices:
+            device type -> indices to return, None for every index
+
+        """
+        dev_types = list(devices)
+        replies = await _gather_or_cancel(
+            self._get_page_result(
+                page="user/icon_status.json",
+                query={"type": dev_type},
+            )
+            for dev_type in dev_types
+        )
+
+        result: dict[str, dict[int, int]] = {}
+        for dev_type, (_, reply_json) in zip(dev_types, replies, strict=True):
+            statuses: list[int] = reply_json["status"]
+            indices = devices[dev_type]
+            if indices is None:
+                indices = range(len(statuses))
+            result[dev_type] = {index: statuses[index] for index in indices}
+            _LOGGER.debug(
+                "[%s] Devices %s status: %s",
+                self._logging,
+                dev_type,
+                result[dev_type],
+            )
+        return result
+
     async def login(self) -> bool:
         """Login to Serial Bridge device."""
         payload = {"dom": self.device_pin}
         return await self._login(payload, BRIDGE)
 
+    async def _async_get_device_type_data(
+        self,
+        dev_type: str,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return description and counter data for a device type."""
+        _, reply_json = await self._get_page_result(
+            page="user/icon_desc.json",
+            query={"type": dev_type},
+        )
+        _LOGGER.debug(
+            "[%s] List of devices of type %s: %s",
+            self._logging,
+            dev_type,
+            reply_json,
+        )
+        if not reply_json:
+            raise DeviceStorageFailureError(
+                f"No data received for device type {dev_type}"
+            )
+
+        reply_counter_json: dict[str, Any] = {}
+        if dev_type == OTHER and reply_json["num"] > 0:
+            _, reply_counter_json = await self._get_page_result(
+                page="user/counter.json",
+            )
+        return reply_json, reply_counter_json
+
+    def _get_cached_descriptions(
+        self,
+        dev_types: Iterable[str],
+    ) -> dict[str, dict[str, Any]] | None:
+        """Return the cached description of every device type, if complete."""
+        if self._description_cache is None:
+            return None
+
+        cached: dict[str, dict[str, Any]] = {}
+        for dev_type in dev_types:
+            if (data := self._description_cache.get(_icon_desc_key(dev_type))) is None:
+                return None
+            cached[dev_type] = data
+        return cached
+
+    async def _async_get_cached_device_type_data(
+        self,
+        dev_type: str,
+        reply_json: dict[str, Any],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return cached description data for a device type with a fresh status."""
+        if not reply_json["num"]:
+            return reply_json, {}
+
+        status_json, reply_counter_json = await self._async_get_device_type_status(
+            dev_type
+        )
+        reply_json = {**reply_json, "status": status_json["status"]}
+        if "val" in status_json:
+            reply_json["val"] = status_json["val"]
+        return reply_json, reply_counter_json
+
     async def get_all_devices(self) -> dict[str, dict[int, ComelitSerialBridgeObject]]:
-        """Get all connected devices."""
+        """Get all connected devices.
+
+        On the first call, descriptions loaded from the on-disk cache are
+        used with a fresh status and checked against the device in the
+        background.
+        """
         _LOGGER.debug("[%s] Getting all devices", self._logging)
 
-        loop = asyncio.get_running_loop()
-        ureg = await loop.run_in_executor(
-            None,
-            functools.partial(pint.UnitRegistry, cache_folder=":auto:"),
+        dev_types = (CLIMATE, COVER, LIGHT, IRRIGATION, OTHER, SCENARIO)
+        if not self._initialized and (
+            cached := self._get_cached_descriptions(dev_types)
+        ):
+            replies = await _gather_or_cancel(
+                self._async_get_cached_device_type_data(dev_type, cached[dev_type])
+                for dev_type in dev_types
+            )
+            try:
+                await self._async_update_devices(dev_types, replies)
+            except IndexError:
+                _LOGGER.debug(
+                    "[%s] Cached descriptions out of date, reloading", self._logging
+                )
+            else:
+                self._devices_from_cache = True
+                self._description_check_pending = True
+                self._schedule_description_check()
+                return self._devices
+
+        replies = await _gather_or_cancel(
+            self._async_get_device_type_data(dev_type) for dev_type in dev_types
+        )
+        # Don't cache the empty descriptions sporadically sent by old bridges
+        await self._async_store_descriptions(
+            {
+                _icon_desc_key(dev_type): reply_json
+                for dev_type, (reply_json, _) in zip(dev_types, replies, strict=True)
+                if reply_json["desc"] or not reply_json["num"]
+            }
         )
-        ureg.formatter.default_format = "~"
+        self._devices_from_cache = False
+        await self._async_update_devices(dev_types, replies)
+        return self._devices
 
-        for dev_type in (CLIMATE, COVER, LIGHT, IRRIGATION, OTHER, SCENARIO):
-            _, reply_json = await self._get_page_result(
-                page="user/icon_desc.json",
-                query={"type": dev_type},
-            )
-            _LOGGER.debug(
-                "[%s] List of devices of type %s: %s",
-                self._logging,
-                dev_type,
-                reply_json,
-            )
-            if not reply_json:
+    async def _async_check_device_descriptions(self) -> None:
+        """Check the cached device descriptions against the bridge.
+
+        The known device objects are kept while the descriptions are
+        unchanged, they are only rebuilt when the configuration changed.
+        """
+        dev_types = tuple(self._devices)
+        replies = await _gather_or_cancel(
+            self._get_page_result(page="user/icon_desc.json", query={"type": dev_type})
+            for dev_type in dev_types
+        )
+        descriptions = {
+            dev_type: reply_json
+            for dev_type, (_, reply_json) in zip(dev_types, replies, strict=True)
+        }
+        for dev_type, reply_json in descriptions.items():
+            if "desc" not in reply_json:
                 raise DeviceStorageFailureError(
                     f"No data received for device type {dev_type}"
                 )
+        changed = await self._async_store_descriptions(
+            {
+                _icon_desc_key(dev_type): reply_json
+                for dev_type, reply_json in descriptions.items()
+                if reply_json["desc"] or not reply_json["num"]
+            }
+        )
+        self._devices_from_cache = False
+        if not changed:
+            _LOGGER.debug("[%s] Cached descriptions up to date", self._logging)
+            self._last_description_update = datetime.now(tz=UTC)
+            return
+
+        _LOGGER.debug("[%s] Device descriptions changed, rebuilding", self._logging)
+        device_replies = await _gather_or_cancel(
+            self._async_get_cached_device_type_data(dev_type, reply_json)
+            for dev_type, reply_json in descriptions.items()
+        )
+        await self._async_update_devices(dev_types, device_replies)
 
-            reply_counter_json: dict[str, Any] = {}
+    async def _async_update_devices(
+        self,
+        dev_types: Iterable[str],
+        replies: Iterable[tuple[dict[str, Any], dict[str, Any]]],
+    ) -> None:
+        """Build the device objects from description and counter data."""
+        for dev_type, (reply_json, reply_counter_json) in zip(
+            dev_types, replies, strict=True
+        ):
             num_devices = reply_json["num"]
-            if dev_type == OTHER and num_devices > 0:
-                _, reply_counter_json = await self._get_page_result(
-                    page="user/counter.json",
-                )
             devices: dict[int, ComelitSerialBridgeObject] = {}
             desc = reply_json["desc"]
             # Guard against some old bridges: sporadically return no data
@@ -690,13 +1522,7 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
                 status = reply_json["status"][i]
                 power = 0.0
                 if instant_values := reply_counter_json.get("instant"):
-                    instant = ureg(instant_values[i])
-                    if not instant.dimensionless:
-                        power = ureg.convert(
-                            instant.magnitude,
-                            str(instant.units),
-                            WATT,
-                        )
+                    power = await async_parse_power(instant_values[i])
                 dev_info = ComelitSerialBridgeObject(
                     index=i,
                     name=reply_json["desc"][i],
@@ -716,8 +1542,109 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
             self._devices.update({dev_type: devices})
 
         self._initialized = True
+        self._last_description_update = datetime.now(tz=UTC)
+
+    async def _async_get_device_type_status(
+        self,
+        dev_type: str,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return status and counter data for a device type."""
+        _, reply_json = await self._get_page_result(
+            page="user/icon_status.json",
+            query={"type": dev_type},
+        )
+        if "status" not in reply_json:
+            raise DeviceStorageFailureError(
+                f"No status received for device type {dev_type}"
+            )
+
+        reply_counter_json: dict[str, Any] = {}
+        if dev_type == OTHER:
+            _, reply_counter_json = await self._get_page_result(
+                page="user/counter.json",
+            )
+        return reply_json, reply_counter_json
+
+    async def refresh_status(
+        self,
+        description_max_age: float = DESCRIPTION_MAX_AGE,
+    ) -> dict[str, dict[int, ComelitSerialBridgeObject]]:
+        """Refresh the status of known devices in place.
+
+        Only the status pages are downloaded. The full device descriptions
+        are reloaded with get_all_devices when none are known yet, or when
+        they are older than description_max_age seconds.
+        """
+        if (
+            self._last_description_update is None
+            or (datetime.now(tz=UTC) - self._last_description_update).total_seconds()
+            > description_max_age
+        ):
+            _LOGGER.debug("[%s] Device descriptions expired", self._logging)
+            return await self.get_all_devices()
+
+        if self._description_check_pending:
+            self._schedule_description_check()
+
+        dev_types = [dev_type for dev_type, devices in self._devices.items() if devices]
+        replies = await _gather_or_cancel(
+            self._async_get_device_type_status(dev_type) for dev_type in dev_types
+        )
+
+        try:
+            for dev_type, (reply_json, reply_counter_json) in zip(
+                dev_types, replies, strict=True
+            ):
+                instant_values = reply_counter_json.get("instant")
+                for index, device in self._devices[dev_type].items():
+                    device.status = reply_json["status"][index]
+                    device.human_status = await self._translate_device_status(
+                        dev_type, device.status
+                    )
+                    if "val" in reply_json:
+                        device.val = reply_json["val"][index]
+                    if instant_values:
+                        device.power = await async_parse_power(instant_values[index])
+                    device.confirmed = True
+        except IndexError:
+            _LOGGER.debug(
+                "[%s] Device list changed, reloading descriptions", self._logging
+            )
+            return await self.get_all_devices()
+
         return self._devices
 
+    async def get_changed_devices(
+        self,
+    ) -> dict[str, dict[int, ComelitSerialBridgeObject]]:
+        """Get devices whose state changed since the previous call.
+
+        Status, human status, value and power are compared, using a
+        status-only refresh. The first call returns every device.
+        """
+        return self._device_tracker.update(await self.refresh_status())
+
+    async def _async_poll_events(self) -> list[ComelitEvent]:
+        """Poll the Serial bridge once and return the state changes.
+
+        Area and zone changes are included once vedo_enabled succeeded.
+        """
+        events: list[ComelitEvent] = [
+            ComelitDeviceEvent(device_type, device)
+            for device_type, devices in (await self.get_changed_devices()).items()
+            for device in devices.values()
+        ]
+        if self._vedo_enabled:
+            events.extend(await super()._async_poll_events())
+        return events
+
+    async def _async_refresh_descriptions(self) -> None:
+        """Download the device and VEDO description pages and update the cache."""
+        if self._devices_from_cache:
+            await self._async_check_device_descriptions()
+        if self._vedo_desc_pages[0] in self._payloads:
+            await super()._async_refresh_descriptions()
+
     async def vedo_enabled(self, vedo_pin: str) -> bool:
         """Check if Serial bridge has VEDO alarm feature."""
         payload = {"alm": vedo_pin}
@@ -730,6 +1657,7 @@ class ComeliteSerialBridgeApi(ComelitCommonApi):
         except (CannotAuthenticate, CannotRetrieveData):
             return False
 
+        self._vedo_enabled = True
         return True
 
 
@@ -0,0 +1,73 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Change detection for Comelit SimpleHome snapshots."""
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    ALARM_AREA,
+    ALARM_AREA_TRACKED_FIELDS,
+    ALARM_ZONE,
+    ALARM_ZONE_TRACKED_FIELDS,
+    DEVICE_TRACKED_FIELDS,
+)
+
+
+def _freeze(value: Any) -> Any:  # noqa: ANN401
+    """Return a hashable copy of a value, turning lists into tuples."""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def tracked_fields(kind: str) -> tuple[str, ...]:
+    """Return the fields compared for a device type, areas or zones."""
+    if kind == ALARM_AREA:
+        return ALARM_AREA_TRACKED_FIELDS
+    if kind == ALARM_ZONE:
+        return ALARM_ZONE_TRACKED_FIELDS
+    return DEVICE_TRACKED_FIELDS
+
+
+class ChangeTracker:
+    """Compare snapshots and keep only the objects whose state changed.
+
+    The tracker stores a copy of the tracked values, so objects updated in
+    place between two polls are still detected as changed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._snapshot: dict[tuple[str, int], tuple[Any, ...]] = {}
+
+    def update[T](
+        self,
+        data: Mapping[str, Mapping[int, T]],
+    ) -> dict[str, dict[int, T]]:
+        """Store a new snapshot and return the new or changed objects."""
+        changes: dict[str, dict[int, T]] = {}
+        for kind, objects in data.items():
+            fields = tracked_fields(kind)
+            for index, obj in objects.items():
+                values = tuple(_freeze(getattr(obj, field)) for field in fields)
+                key = (kind, index)
+                if self._snapshot.get(key) == values:
+                    continue
+                self._snapshot[key] = values
+                changes.setdefault(kind, {})[index] = obj
+
+            # Forget removed objects, they are reported again if they come back
+            removed = [
+                key
+                for key in self._snapshot
+                if key[0] == kind and key[1] not in objects
+            ]
+            for key in removed:
+                del self._snapshot[key]
+        return changes
+
+    def reset(self) -> None:
+        """Forget the previous snapshot, next update reports everything."""
+        self._snapshot.clear()
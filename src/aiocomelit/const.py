@@ -12,6 +12,9 @@ _LOGGER = logging.getLogger(__package__)
 
 DEFAULT_TIMEOUT = ClientTimeout(10)
 
+# Max requests in flight against a single host
+DEFAULT_MAX_CONCURRENT_REQUESTS = 1
+
 # Host types
 BRIDGE = "Serial bridge"
 VEDO = "Vedo system"
@@ -26,8 +29,15 @@ SCENARIO = "scenario"
 ALARM_AREA = "alarm_areas"
 ALARM_ZONE = "alarm_zones"
 
+# Climate commands
+CLIMATE_MODES = ("thermo", "humi")  # Order of the values in a climate "val"
+CLIMATE_SET = "set"
+CLIMATE_SET_POINT = 4  # Set-point position in a climate mode value
+
 # Statuses
 STATE_COVER: list[str] = ["stopped", "opening", "closing"]
+# Status of a stopped cover expected after a close (0) or open (1) action
+STATE_COVER_ACTION: list[int] = [2, 1]
 STATE_OFF = 0
 STATE_ON = 1
 
@@ -64,6 +74,9 @@ class AlarmZoneState(Enum):
 
 ALARM_DISABLE = "dis"
 ALARM_ENABLE = "tot"
+ALARM_ALL_AREAS = 32
+# Area "armed" value expected after an action
+ALARM_ACTION_ARMED: dict[str, int] = {ALARM_DISABLE: 0, ALARM_ENABLE: 4}
 ALARM_AREA_STATUS: dict[str, AlarmAreaState] = {
     "out_time": AlarmAreaState.EXIT_DELAY,
     "in_time": AlarmAreaState.ENTRY_DELAY,
@@ -87,10 +100,59 @@ ALARM_ZONE_STATUS: dict[int, AlarmZoneState] = {
     32768: AlarmZoneState.INHIBITED,
 }
 
+# Seconds between two polls of watch()
+DEFAULT_WATCH_INTERVAL = 5.0
+
+# Fields compared to detect a state change
+DEVICE_TRACKED_FIELDS = ("status", "human_status", "val", "power")
+ALARM_AREA_TRACKED_FIELDS = (
+    "ready",
+    "armed",
+    "alarm",
+    "alarm_memory",
+    "sabotage",
+    "anomaly",
+    "in_time",
+    "out_time",
+    "human_status",
+)
+ALARM_ZONE_TRACKED_FIELDS = ("status", "human_status")
+
 # Min wait time between http calls
 SLEEP_BETWEEN_BRIDGE_CALLS = 1.5
 SLEEP_BETWEEN_VEDO_CALLS = 0.25
 SLEEP_AFTER_VEDO_LOGIN = 1.5
 
+# Default request rate (requests/s) per host type, None for no limit
+DEFAULT_RATE_LIMIT: dict[str, float | None] = {
+    BRIDGE: None,
+    VEDO: 1 / SLEEP_BETWEEN_VEDO_CALLS,
+}
+
+# Max age (seconds) of device descriptions reused by a status-only refresh
+DESCRIPTION_MAX_AGE = 3600
+
+# Description page keys ignored when checking a cached description for changes
+DESCRIPTION_VOLATILE_KEYS = ("logged", "rt_stat", "life", "status", "val")
+
+# Status pages that can be served from a short-lived cache
+STATUS_CACHE_PAGES = (
+    "icon_status.json",
+    "counter.json",
+    "area_stat.json",
+    "zone_stat.json",
+)
+
+# Request priorities, lower values are sent first
+PRIORITY_ALARM = 0
+PRIORITY_DEVICE = 1
+PRIORITY_CLIMATE = 2
+PRIORITY_POLL = 3
+
+# Adaptive rate limiting
+RATE_LIMIT_SLOW_RESPONSE = 2.0
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+RATE_LIMIT_INCREASE_STEPS = 10
+
 # DEFAULT POWER UNIT
 WATT = "W"
@@ -0,0 +1,160 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Decoders for Comelit SimpleHome VEDO status pages."""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from .const import ALARM_AREA_STATUS, ALARM_ZONE_STATUS, AlarmAreaState, AlarmZoneState
+from .exceptions import CannotRetrieveData
+from .models import ComelitVedoAreaObject, ComelitVedoZoneObject
+
+# Area states by status flag, in the order they are checked
+_AREA_STATES = tuple(ALARM_AREA_STATUS.values())
+
+# Zone states are looked up by the low status bits, every flag below
+# 1 << ZONE_TABLE_BITS is checked before the higher ones (ALARM_ZONE_STATUS)
+ZONE_TABLE_BITS = 10
+_ZONE_TABLE_MASK = (1 << ZONE_TABLE_BITS) - 1
+
+
+def _scan_zone_state(status: int) -> AlarmZoneState:
+    """Return the state of the first zone status flag set."""
+    for flag, state in ALARM_ZONE_STATUS.items():
+        if status & flag:
+            return state
+
+    return AlarmZoneState.REST
+
+
+_ZONE_STATE_TABLE = tuple(
+    _scan_zone_state(status) for status in range(1 << ZONE_TABLE_BITS)
+)
+
+
+def zone_state(status: int) -> AlarmZoneState:
+    """Return the state of a decoded zone status."""
+    state = _ZONE_STATE_TABLE[status & _ZONE_TABLE_MASK]
+    if state is AlarmZoneState.REST and status > _ZONE_TABLE_MASK:
+        return _scan_zone_state(status)
+    return state
+
+
+def decode_zone_statuses(status: str) -> list[tuple[str, int, AlarmZoneState]]:
+    """Decode a zone_stat status string.
+
+    Return the raw value, the decoded status and the state of every zone,
+    by zone index.
+    """
+    decoded: list[tuple[str, int, AlarmZoneState]] = []
+    for status_api in status.split(","):
+        value = int(status_api, 16)
+        decoded.append((status_api, value, zone_state(value)))
+    return decoded
+
+
+def area_state(flags: Iterable[Any]) -> AlarmAreaState:
+    """Return the state of an area from its flags in ALARM_AREA_STATUS order."""
+    for flag, state in zip(flags, _AREA_STATES, strict=False):
+        if flag:
+            return state
+
+    return AlarmAreaState.DISARMED
+
+
+def decode_area_states(area_stat: Mapping[str, list[Any]]) -> list[AlarmAreaState]:
+    """Decode the state of every area of an area_stat page, by area index."""
+    columns = [area_stat[field] for field in ALARM_AREA_STATUS]
+    try:
+        return [area_state(flags) for flags in zip(*columns, strict=True)]
+    except ValueError as exc:
+        raise CannotRetrieveData("AREA statistics columns don't match") from exc
+
+
+def decode_areas(
+    json_area_desc: Mapping[str, Any],
+    json_area_stat: Mapping[str, Any],
+) -> dict[int, ComelitVedoAreaObject]:
+    """Build the present areas in one pass over area_desc and area_stat."""
+    columns = zip(
+        json_area_desc["present"],
+        json_area_desc["description"],
+        json_area_desc["p1_pres"],
+        json_area_desc["p2_pres"],
+        json_area_stat["ready"],
+        json_area_stat["armed"],
+        json_area_stat["alarm"],
+        json_area_stat["alarm_memory"],
+        json_area_stat["sabotage"],
+        json_area_stat["anomaly"],
+        json_area_stat["in_time"],
+        json_area_stat["out_time"],
+        decode_area_states(json_area_stat),
+        strict=True,
+    )
+    try:
+        return {
+            index: ComelitVedoAreaObject(
+                index=index,
+                name=name,
+                p1=p1,
+                p2=p2,
+                ready=ready,
+                armed=armed,
+                alarm=alarm,
+                alarm_memory=alarm_memory,
+                sabotage=sabotage,
+                anomaly=anomaly,
+                in_time=in_time,
+                out_time=out_time,
+                human_status=human_status,
+            )
+            for index, (
+                present,
+                name,
+                p1,
+                p2,
+                ready,
+                armed,
+                alarm,
+                alarm_memory,
+                sabotage,
+                anomaly,
+                in_time,
+                out_time,
+                human_status,
+            ) in enumerate(columns)
+            if present
+        }
+    except ValueError as exc:
+        raise CannotRetrieveData("AREA description and statistics don't match") from exc
+
+
+def decode_zones(
+    json_zone_desc: Mapping[str, Any],
+    json_zone_stat: Mapping[str, Any],
+) -> dict[int, ComelitVedoZoneObject]:
+    """Build the present zones in one pass over zone_desc and zone_stat."""
+    try:
+        columns = zip(
+            json_zone_desc["present"],
+            json_zone_desc["description"],
+            decode_zone_statuses(json_zone_stat["status"]),
+            strict=True,
+        )
+        return {
+            index: ComelitVedoZoneObject(
+                index=index,
+                name=name,
+                status_api=status_api,
+                status=status,
+                human_status=human_status,
+            )
+            for index, (present, name, (status_api, status, human_status)) in enumerate(
+                columns
+            )
+            if int(present)
+        }
+    except ValueError as exc:
+        raise CannotRetrieveData("ZONE description and statistics don't match") from exc
@@ -0,0 +1,182 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Request pacing for Comelit SimpleHome devices."""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+
+from .const import (
+    _LOGGER,
+    RATE_LIMIT_DECREASE_FACTOR,
+    RATE_LIMIT_INCREASE_STEPS,
+    RATE_LIMIT_SLOW_RESPONSE,
+)
+
+
+class RateLimiter:
+    """Token bucket rate limiter for requests against a single host.
+
+    rate:
+        requests per second, None for no limit
+
+    burst:
+        requests that can be sent back to back when the bucket is full
+
+    adaptive:
+        halve the rate on errors or slow responses and raise it back
+        towards the configured rate while the device is healthy
+
+    min_rate:
+        lowest rate the adaptive mode can fall to
+
+    slow_response:
+        response time, in seconds, considered a sign of an overloaded device
+
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int = 1,
+        *,
+        adaptive: bool = False,
+        min_rate: float | None = None,
+        slow_response: float = RATE_LIMIT_SLOW_RESPONSE,
+    ) -> None:
+        """Initialize the rate limiter."""
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if adaptive and rate is None:
+            raise ValueError("adaptive mode requires a rate")
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else (rate or 0) / 10
+        self.burst = burst
+        self.adaptive = adaptive
+        self.slow_response = slow_response
+        self._rate = rate
+        self._tokens = float(burst)
+        self._updated: float | None = None
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float | None:
+        """Return the current rate in requests per second."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        if self._rate is not None and self._updated is not None:
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._updated) * self._rate,
+            )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request can be sent."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                self._refill(now)
+                delay = self._paused_until - now
+                if delay <= 0 and (self._rate is None or self._tokens >= 1):
+                    break
+                if delay <= 0 and self._rate is not None:
+                    delay = (1 - self._tokens) / self._rate
+                _LOGGER.debug("Rate limiting: sleeping for %.3f seconds", delay)
+                await asyncio.sleep(delay)
+
+            if self._rate is not None:
+                self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for the given number of seconds."""
+        now = asyncio.get_running_loop().time()
+        self._paused_until = max(self._paused_until, now + seconds)
+
+    def record_success(self, elapsed: float) -> None:
+        """Record a successful response and how long it took."""
+        if not self.adaptive or self._rate is None or self.max_rate is None:
+            return
+
+        if elapsed >= self.slow_response:
+            self._slow_down()
+            return
+
+        self._rate = min(
+            self.max_rate,
+            self._rate + self.max_rate / RATE_LIMIT_INCREASE_STEPS,
+        )
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        if self.adaptive and self._rate is not None:
+            self._slow_down()
+
+    def _slow_down(self) -> None:
+        """Reduce the current rate."""
+        if self._rate is None:
+            return
+
+        self._rate = max(self.min_rate, self._rate * RATE_LIMIT_DECREASE_FACTOR)
+        _LOGGER.debug("Rate limiting: slowing down to %.3f requests/s", self._rate)
+
+
+class PriorityScheduler:
+    """Limit the requests in flight against a single host.
+
+    Free slots go to the waiting request with the lowest priority value,
+    in arrival order for equal priorities (see the PRIORITY_* constants).
+    """
+
+    def __init__(self, max_concurrent: int = 1) -> None:
+        """Initialize the scheduler."""
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Wait for a free slot and hold it while the context is active."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait until a slot is granted."""
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Give back a slot granted while the waiter was being cancelled
+            if not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Free a slot and grant it to the next waiter."""
+        self._active -= 1
+        while self._waiters and self._active < self.max_concurrent:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._active += 1
+            future.set_result(None)
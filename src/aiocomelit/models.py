@@ -0,0 +1,82 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Models for Comelit SimpleHome devices, areas and zones."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from .const import WATT, AlarmAreaState, AlarmZoneState
+
+
+@dataclass(slots=True)
+class ComelitSerialBridgeObject:
+    """Comelit SimpleHome Serial bridge class."""
+
+    index: int
+    name: str
+    status: int
+    human_status: str
+    type: str
+    val: int | list[list[Any]]  # Temperature or Humidity (CLIMATE)
+    protected: int
+    zone: str
+    power: float
+    power_unit: str = WATT
+    confirmed: bool = True  # False until a poll confirms a commanded state
+
+
+@dataclass(slots=True)
+class ComelitVedoAreaObject:
+    """Comelit SimpleHome VEDO area class."""
+
+    index: int
+    name: str
+    p1: bool
+    p2: bool
+    ready: bool
+    armed: int
+    alarm: bool
+    alarm_memory: bool
+    sabotage: bool
+    anomaly: bool
+    in_time: bool
+    out_time: bool
+    human_status: AlarmAreaState
+    confirmed: bool = True  # False until a poll confirms a commanded state
+
+
+@dataclass(slots=True)
+class ComelitVedoZoneObject:
+    """Comelit SimpleHome VEDO zone class."""
+
+    index: int
+    name: str
+    status_api: str
+    status: int
+    human_status: AlarmZoneState
+
+
+@dataclass(frozen=True, slots=True)
+class ComelitDeviceEvent:
+    """Comelit SimpleHome Serial bridge device state change."""
+
+    device_type: str
+    device: ComelitSerialBridgeObject
+
+
+@dataclass(frozen=True, slots=True)
+class ComelitVedoAreaEvent:
+    """Comelit SimpleHome VEDO area state change."""
+
+    area: ComelitVedoAreaObject
+
+
+@dataclass(frozen=True, slots=True)
+class ComelitVedoZoneEvent:
+    """Comelit SimpleHome VEDO zone state change."""
+
+    zone: ComelitVedoZoneObject
+
+
+type ComelitEvent = ComelitDeviceEvent | ComelitVedoAreaEvent | ComelitVedoZoneEvent
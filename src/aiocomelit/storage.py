@@ -0,0 +1,160 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Storage for Comelit SimpleHome description and status pages."""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from .const import _LOGGER, DESCRIPTION_VOLATILE_KEYS
+
+
+def fingerprint(payload: dict[str, Any]) -> str:
+    """Return a fingerprint of a description payload.
+
+    Keys that change between two polls (login state, status values) are
+    ignored, so only a configuration change produces a new fingerprint.
+    """
+    stable = {
+        key: value
+        for key, value in payload.items()
+        if key not in DESCRIPTION_VOLATILE_KEYS
+    }
+    return hashlib.sha256(orjson.dumps(stable, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+class DescriptionCache:
+    """Description pages of one host, persisted to a JSON file."""
+
+    def __init__(self, cache_dir: Path, host: str, port: int) -> None:
+        """Initialize the cache and load the stored pages."""
+        self.path = cache_dir / f"aiocomelit_{host}_{port}.json"
+        self._host = host
+        self._port = port
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load the stored pages, ignoring a missing or unreadable file."""
+        try:
+            data = orjson.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError) as exc:
+            _LOGGER.debug("Ignoring description cache %s: %s", self.path, exc)
+            return
+
+        if data.get("host") != self._host or data.get("port") != self._port:
+            _LOGGER.debug("Ignoring description cache %s: host mismatch", self.path)
+            return
+
+        self._entries = {
+            key: entry
+            for key, entry in data.get("entries", {}).items()
+            if entry.get("fingerprint") == fingerprint(entry.get("payload", {}))
+        }
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a stored page."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        payload: dict[str, Any] = entry["payload"]
+        return payload
+
+    def set(self, key: str, payload: dict[str, Any]) -> bool:
+        """Store a page and return True if its content changed."""
+        new_fingerprint = fingerprint(payload)
+        entry = self._entries.get(key)
+        changed = entry is None or entry["fingerprint"] != new_fingerprint
+        self._entries[key] = {"fingerprint": new_fingerprint, "payload": payload}
+        self._dirty |= changed
+        return changed
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop the given pages, removed from disk on the next save."""
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the pages to disk if any of them changed (blocking)."""
+        if not self._dirty:
+            return
+
+        data = {"host": self._host, "port": self._port, "entries": self._entries}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(data))
+            tmp_path.replace(self.path)
+        except OSError as exc:
+            _LOGGER.warning("Unable to save description cache %s: %s", self.path, exc)
+            return
+
+        self._dirty = False
+
+
+@dataclass(slots=True)
+class StoredPayload:
+    """Current payload of a page."""
+
+    data: dict[str, Any]
+    version: int
+
+
+class PayloadStore:
+    """In-memory store holding the current payload of every page.
+
+    Every page keeps a single payload, replaced on each update, and a
+    version increased whenever its content changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._entries: dict[str, StoredPayload] = {}
+
+    def __contains__(self, page: object) -> bool:
+        """Return True if a payload is stored for the page."""
+        return page in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of pages stored."""
+        return len(self._entries)
+
+    def get(self, page: str) -> dict[str, Any]:
+        """Return the payload of a page, empty if not stored."""
+        if (entry := self._entries.get(page)) is None:
+            return {}
+        return entry.data
+
+    def version(self, page: str) -> int:
+        """Return the version of a page, 0 if not stored."""
+        if (entry := self._entries.get(page)) is None:
+            return 0
+        return entry.version
+
+    def set(self, page: str, data: dict[str, Any]) -> bool:
+        """Replace the payload of a page and return True if it changed."""
+        entry = self._entries.get(page)
+        if entry is None:
+            self._entries[page] = StoredPayload(data, 1)
+            return True
+
+        changed = entry.data != data
+        entry.data = data
+        if changed:
+            entry.version += 1
+        return changed
+
+    def invalidate(self, *pages: str) -> None:
+        """Drop the given pages, or every page if none is given."""
+        if not pages:
+            self._entries.clear()
+            return
+        for page in pages:
+            self._entries.pop(page, None)
@@ -0,0 +1,100 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Power unit handling for Comelit SimpleHome."""
+
+import asyncio
+import re
+import threading
+from typing import Any, cast
+
+import pint
+
+from .const import _LOGGER, WATT
+
+_UREG: pint.UnitRegistry[Any] | None = None
+_UREG_LOCK = threading.Lock()
+
+# Power strings reported by the bridge, e.g. "123 W", "1.2 kW" or "0 W"
+_POWER_PATTERN = re.compile(
+    r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(?:([mkMG]?)W)?\s*"
+)
+_POWER_PREFIXES: dict[str, float] = {
+    "": 1.0,
+    "m": 1e-3,
+    "k": 1e3,
+    "M": 1e6,
+    "G": 1e9,
+}
+
+
+def get_unit_registry() -> pint.UnitRegistry[Any]:
+    """Return the process-wide unit registry, creating it on first use.
+
+    Creating a registry is expensive (hundreds of milliseconds without the
+    on-disk cache), so it is built once and shared by every API instance.
+    This call blocks while the registry is created: from the event loop use
+    `async_get_unit_registry` instead.
+    """
+    global _UREG  # noqa: PLW0603
+
+    if _UREG is not None:
+        return _UREG
+
+    with _UREG_LOCK:
+        if _UREG is None:
+            _LOGGER.debug("Creating shared pint unit registry")
+            ureg: pint.UnitRegistry[Any] = pint.UnitRegistry(cache_folder=":auto:")
+            ureg.formatter.default_format = "~"
+            _UREG = ureg
+
+    return _UREG
+
+
+async def async_get_unit_registry() -> pint.UnitRegistry[Any]:
+    """Return the process-wide unit registry without blocking the event loop.
+
+    Await it during setup to warm up the registry ahead of the first poll.
+    """
+    if _UREG is not None:
+        return _UREG
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_unit_registry)
+
+
+def parse_power_fast(value: str) -> float | None:
+    """Convert a simple power string to watts without pint.
+
+    Empty strings and bare numbers are dimensionless and map to 0.0.
+    Return None if the string is not a plain SI power value.
+    """
+    if not value:
+        return 0.0
+
+    if (match := _POWER_PATTERN.fullmatch(value)) is None:
+        return None
+
+    magnitude, prefix = match.groups()
+    if prefix is None:
+        return 0.0
+
+    return float(magnitude) * _POWER_PREFIXES[prefix]
+
+
+def parse_power(ureg: pint.UnitRegistry[Any], value: str) -> float:
+    """Convert any power string understood by pint to watts."""
+    instant = ureg(value)
+    if instant.dimensionless:
+        return 0.0
+
+    return cast("float", ureg.convert(instant.magnitude, str(instant.units), WATT))
+
+
+async def async_parse_power(value: str) -> float:
+    """Convert a power string to watts, using pint only for unusual formats."""
+    if (power := parse_power_fast(value)) is not None:
+        return power
+
+    _LOGGER.debug("Parsing power value '%s' with pint", value)
+    return parse_power(await async_get_unit_registry(), value)
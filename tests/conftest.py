@@ -15,8 +15,10 @@ import pytest
 from aiohttp import ClientSession
 from aioresponses import aioresponses
 
+from aiocomelit import api as api_module
+
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Awaitable, Callable
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
     from typing import Any
 
 JsonScalar = str | int | float | bool | None
@@ -88,6 +90,28 @@ def make_get_page_result_mock(
     return fake_get
 
 
+@pytest.fixture(autouse=True)
+def clear_firmware_cache() -> Generator[None]:
+    """Forget the VEDO firmware generations detected by a test."""
+    yield
+    vars(api_module)["_FIRMWARE_CACHE"].clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_status_generations() -> Generator[None]:
+    """Forget the per-host status cache generations of a test."""
+    yield
+    vars(api_module)["_STATUS_GENERATIONS"].clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limiters() -> Generator[None]:
+    """Forget the per-host rate limiters and schedulers created by a test."""
+    yield
+    vars(api_module)["_RATE_LIMITERS"].clear()
+    vars(api_module)["_SCHEDULERS"].clear()
+
+
 @pytest.fixture
 async def mock_session() -> AsyncGenerator[ClientSession]:
     """Return a real ClientSession for testing."""
@@ -108,8 +132,8 @@ def mock_get_session() -> Callable[[int, dict[str, Any] | None], AsyncMock]:
 
     def _build(status: int, json_data: dict[str, Any] | None = None) -> AsyncMock:
         response = AsyncMock(status=status)
-        if json_data is not None:
-            response.json = AsyncMock(return_value=json_data)
+        body = orjson.dumps(json_data) if json_data is not None else b""
+        response.read = AsyncMock(return_value=body)
         return AsyncMock(get=AsyncMock(return_value=response))
 
     return _build
@@ -124,3 +148,16 @@ def fixture_loader() -> Callable[[str], dict[str, JsonValue]]:
         return cast("dict[str, JsonValue]", orjson.loads(fixture_path.read_bytes()))
 
     return _load
+
+
+@pytest.fixture
+def bridge_pages(
+    fixture_loader: Callable[[str], dict[str, JsonValue]],
+) -> dict[str, dict[str, Any]]:
+    """Return the Serial bridge description and counter pages by query."""
+    pages: dict[str, dict[str, Any]] = {
+        f"user/icon_desc.json?type={dev_type}": fixture_loader(f"bridge/{dev_type}")
+        for dev_type in ("clima", "shutter", "light", "irrigation", "other", "scenario")
+    }
+    pages["user/counter.json"] = {"instant": ["1 kW"], "logged": 1}
+    return pages
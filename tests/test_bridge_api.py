@@ -5,22 +5,26 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from http import HTTPStatus
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 from unittest.mock import AsyncMock
 
+import orjson
 import pytest
 
 from aiocomelit.api import ComeliteSerialBridgeApi
 from aiocomelit.const import BRIDGE, CLIMATE, COVER, LIGHT, OTHER, SCENARIO
 from aiocomelit.exceptions import (
     CannotAuthenticate,
+    CannotConnect,
     CannotRetrieveData,
     DeviceStorageFailureError,
 )
 from tests.conftest import (
     call_private_async,
+    get_private_attr,
     make_get_page_result_mock,
     set_private_attr,
     setup_api,
@@ -28,8 +32,10 @@ from tests.conftest import (
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
+    from pathlib import Path
 
     from aiohttp import ClientSession
+    from yarl import URL
 
 SCENARIO_COUNT = 3
 
@@ -110,6 +116,106 @@ async def test_set_thermo_humi_status_waits_and_scales(
     assert called_query["val"] == 225
 
 
+async def test_set_thermo_humi_status_coalesces_pending_commands(
+    mock_session: ClientSession,
+) -> None:
+    """Test only the latest pending set-point per climate is sent."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    set_private_attr(api, "_sleep_between_call", AsyncMock())
+    sent: list[dict[str, object]] = []
+
+    async def fake_get(**kwargs: dict[str, object]) -> tuple[int, dict[str, object]]:
+        """Record sent commands, failing the one for the second climate."""
+        sent.append(kwargs["query"])
+        await asyncio.sleep(0)
+        status = (
+            HTTPStatus.OK if kwargs["query"]["clima"] == 0 else HTTPStatus.BAD_GATEWAY
+        )
+        return status, {}
+
+    set_private_attr(api, "_get_page_result", AsyncMock(side_effect=fake_get))
+
+    results = await asyncio.gather(
+        *(api.set_clima_status(0, "set", temp) for temp in (20, 21, 22, 23)),
+        api.set_clima_status(1, "set", 18),
+        api.set_clima_status(0, "auto"),
+        api.set_clima_status(0, "set", 24),
+    )
+
+    assert results == [True, True, True, True, False, True, True]
+    assert [(query["clima"], query["thermo"], query["val"]) for query in sent] == [
+        (0, "set", 230),
+        (1, "set", 180),
+        (0, "auto", 0),
+        (0, "set", 240),
+    ]
+
+
+async def test_set_thermo_humi_status_merges_during_spacing(
+    mock_session: ClientSession,
+) -> None:
+    """Test set-points arriving while a command waits its turn are merged."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    set_private_attr(api, "_last_clima_command", datetime.now(tz=UTC))
+    release = asyncio.Event()
+
+    async def fake_sleep(_seconds: float) -> None:
+        """Hold the spacing wait until released."""
+        await release.wait()
+
+    set_private_attr(api, "_sleep_between_call", fake_sleep)
+    get_mock = AsyncMock(return_value=(HTTPStatus.OK, {}))
+    set_private_attr(api, "_get_page_result", get_mock)
+
+    first = asyncio.create_task(api.set_clima_status(0, "set", 20))
+    await asyncio.sleep(0)
+    later = [
+        asyncio.create_task(api.set_clima_status(0, "set", temp)) for temp in (21, 22)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, *later) == [True, True, True]
+    get_mock.assert_awaited_once()
+    assert get_mock.await_args is not None
+    assert get_mock.await_args.kwargs["query"]["val"] == 220
+
+
+async def test_set_thermo_humi_status_survives_cancelled_caller(
+    mock_session: ClientSession,
+) -> None:
+    """Test merged callers still get their command if the first one is cancelled."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    set_private_attr(api, "_sleep_between_call", AsyncMock())
+    sent: list[tuple[object, object]] = []
+    release = asyncio.Event()
+
+    async def fake_get(**kwargs: dict[str, object]) -> tuple[int, dict[str, object]]:
+        """Record sent commands, holding the first one until released."""
+        sent.append((kwargs["query"]["clima"], kwargs["query"]["val"]))
+        if len(sent) == 1:
+            await release.wait()
+        return HTTPStatus.OK, {}
+
+    set_private_attr(api, "_get_page_result", AsyncMock(side_effect=fake_get))
+
+    other = asyncio.create_task(api.set_clima_status(1, "set", 18))
+    await asyncio.sleep(0.01)
+    first = asyncio.create_task(api.set_clima_status(0, "set", 20))
+    await asyncio.sleep(0)
+    merged = asyncio.create_task(api.set_clima_status(0, "set", 22))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await merged is True
+    assert await other is True
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert sent == [(1, 180), (0, 220)]
+
+
 async def test_set_clima_and_humidity_wrappers(mock_session: ClientSession) -> None:
     """Test climate/humidity wrapper methods delegate correctly."""
     api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
@@ -149,6 +255,96 @@ async def test_set_device_status(
     assert call_args.kwargs["query"][expected_key] == expected_value
 
 
+async def test_set_devices_status(mock_session: ClientSession) -> None:
+    """Test bulk commands run one at a time and report each result."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    in_flight = 0
+    sent: list[dict[str, object]] = []
+
+    async def fake_get(**kwargs: dict[str, object]) -> tuple[int, dict[str, object]]:
+        """Record commands, checking none overlap, and fail index 3."""
+        nonlocal in_flight
+        in_flight += 1
+        assert in_flight == 1
+        await asyncio.sleep(0)
+        in_flight -= 1
+        sent.append(kwargs["query"])
+        if kwargs["query"].get("num0") == 3:
+            raise CannotRetrieveData("GET response status 500")
+        return HTTPStatus.OK, {}
+
+    set_private_attr(api, "_get_page_result", AsyncMock(side_effect=fake_get))
+
+    results = await api.set_devices_status(COVER, {0: 1, 3: 0, 5: 0})
+
+    assert results == {0: True, 3: False, 5: True}
+    assert sent == [
+        {"type": COVER, "num1": 0},
+        {"type": COVER, "num0": 3},
+        {"type": COVER, "num0": 5},
+    ]
+
+    # An unreachable bridge stops the batch
+    get_mock = AsyncMock(side_effect=CannotConnect("Connection error during GET"))
+    set_private_attr(api, "_get_page_result", get_mock)
+    results = await api.set_devices_status(COVER, {0: 1, 3: 0, 5: 0})
+
+    assert results == {0: False, 3: False, 5: False}
+    get_mock.assert_awaited_once()
+
+
+async def test_commands_update_devices_optimistically(
+    mock_session: ClientSession,
+    bridge_pages: dict[str, dict[str, object]],
+) -> None:
+    """Test successful commands update known devices until a poll confirms."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(side_effect=make_get_page_result_mock(bridge_pages)),
+    )
+    devices = await api.get_all_devices()
+    clima_val = devices[CLIMATE][0].val
+
+    set_private_attr(api, "_sleep_between_call", AsyncMock())
+    set_private_attr(
+        api, "_get_page_result", AsyncMock(return_value=(HTTPStatus.OK, {}))
+    )
+    assert await api.set_device_status(LIGHT, 0, 1) is True
+    assert await api.set_device_status(COVER, 0, 0) is True
+    assert await api.set_clima_status(0, "set", 21.5) is True
+
+    light = devices[LIGHT][0]
+    assert (light.status, light.human_status, light.confirmed) == (1, "on", False)
+    cover = devices[COVER][0]
+    assert (cover.status, cover.human_status, cover.confirmed) == (2, "closing", False)
+    clima = devices[CLIMATE][0]
+    assert isinstance(clima.val, list)
+    assert clima.val[0][4] == 215
+    assert clima.confirmed is False
+    assert clima_val is not clima.val
+
+    # A command may stop a moving cover, its state is left to the next poll
+    assert await api.set_device_status(COVER, 0, 0) is True
+    assert (cover.status, cover.human_status) == (2, "closing")
+
+    # The next poll confirms or corrects the commanded state
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(
+            side_effect=make_get_page_result_mock(
+                {"user/counter.json": {"instant": ["1 kW"], "logged": 1}},
+                default={"status": [0] * 32},
+            )
+        ),
+    )
+    await api.refresh_status()
+    assert (light.status, light.human_status, light.confirmed) == (0, "off", True)
+    assert cover.confirmed is True
+
+
 async def test_get_device_status(mock_session: ClientSession) -> None:
     """Test reading a single device status index."""
     api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
@@ -161,6 +357,25 @@ async def test_get_device_status(mock_session: ClientSession) -> None:
     assert await api.get_device_status(LIGHT, 1) == 1
 
 
+async def test_get_devices_status(mock_session: ClientSession) -> None:
+    """Test reading many device statuses with one request per type."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    get_mock = AsyncMock(
+        side_effect=make_get_page_result_mock(
+            {
+                "user/icon_status.json?type=light": {"status": [0, 1, 0, 1]},
+                "user/icon_status.json?type=shutter": {"status": [2, 0]},
+            }
+        )
+    )
+    set_private_attr(api, "_get_page_result", get_mock)
+
+    statuses = await api.get_devices_status({LIGHT: [1, 3], COVER: None})
+
+    assert statuses == {LIGHT: {1: 1, 3: 1}, COVER: {0: 2, 1: 0}}
+    assert get_mock.await_count == 2
+
+
 @pytest.mark.parametrize(
     ("counter_payload", "expected_power"),
     [
@@ -201,6 +416,269 @@ async def test_get_all_devices_with_real_fixtures(
     assert bool(object.__getattribute__(api, "_initialized")) is True
 
 
+async def test_get_all_devices_concurrent_matches_sequential(
+    mock_session: ClientSession,
+    bridge_pages: dict[str, dict[str, object]],
+) -> None:
+    """Test concurrent device retrieval honors the limit and keeps the output."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_get(url: URL, **_kwargs: object) -> AsyncMock:
+        """Return fixture payloads while tracking concurrent requests."""
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        key = url.path.lstrip("/")
+        if "type" in url.query:
+            key = f"{key}?type={url.query['type']}"
+
+        async def read() -> bytes:
+            nonlocal in_flight
+            in_flight -= 1
+            return orjson.dumps(bridge_pages[key])
+
+        return AsyncMock(status=HTTPStatus.OK, read=AsyncMock(side_effect=read))
+
+    results = []
+    peaks = []
+    for max_concurrent_requests in (1, 3):
+        api = ComeliteSerialBridgeApi(
+            "127.0.0.1",
+            80 + max_concurrent_requests,
+            "1234",
+            mock_session,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        set_private_attr(
+            api, "_session", AsyncMock(get=AsyncMock(side_effect=fake_get))
+        )
+        peak = 0
+        results.append(await api.get_all_devices())
+        peaks.append(peak)
+
+    assert results[0] == results[1]
+    assert peaks == [1, 3]
+
+
+async def test_max_concurrent_requests_must_be_positive(
+    mock_session: ClientSession,
+) -> None:
+    """Test an invalid concurrency limit is rejected."""
+    with pytest.raises(ValueError, match="max_concurrent_requests"):
+        ComeliteSerialBridgeApi(
+            "127.0.0.1", 80, "1234", mock_session, max_concurrent_requests=0
+        )
+
+
+async def test_refresh_status_updates_devices_in_place(
+    mock_session: ClientSession,
+    bridge_pages: dict[str, dict[str, object]],
+) -> None:
+    """Test status-only refresh updates cached devices without descriptions."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(
+            side_effect=make_get_page_result_mock(
+                bridge_pages, default={"status": [0] * 32, "val": [0] * 32}
+            )
+        ),
+    )
+    devices = await api.get_all_devices()
+    light = devices[LIGHT][0]
+    assert light.status == 0
+
+    status_mock = AsyncMock(
+        side_effect=make_get_page_result_mock(
+            {"user/counter.json": {"instant": ["250 W"], "logged": 1}},
+            default={"status": [1] * 32, "val": [5] * 32},
+        )
+    )
+    set_private_attr(api, "_get_page_result", status_mock)
+
+    refreshed = await api.refresh_status()
+
+    assert refreshed[LIGHT][0] is light
+    assert light.status == 1
+    assert light.human_status == "on"
+    assert light.val == 5
+    assert refreshed[OTHER][0].power == pytest.approx(250.0)
+    pages = {call.kwargs["page"] for call in status_mock.await_args_list}
+    assert pages == {"user/icon_status.json", "user/counter.json"}
+
+    # Expired descriptions trigger a full reload
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(side_effect=make_get_page_result_mock(bridge_pages)),
+    )
+    refreshed = await api.refresh_status(description_max_age=-1)
+    assert refreshed[LIGHT][0] is not light
+
+    # An empty reply, the session could not be renewed
+    set_private_attr(
+        api, "_get_page_result", AsyncMock(return_value=(HTTPStatus.OK, {}))
+    )
+    with pytest.raises(DeviceStorageFailureError):
+        await api.refresh_status()
+
+
+async def test_get_all_devices_warm_start_from_description_cache(
+    mock_session: ClientSession,
+    bridge_pages: dict[str, dict[str, object]],
+    tmp_path: Path,
+) -> None:
+    """Test cached descriptions are used at once and checked in background."""
+    api = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, description_cache_dir=tmp_path
+    )
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(side_effect=make_get_page_result_mock(bridge_pages)),
+    )
+    await api.get_all_devices()
+
+    api = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, description_cache_dir=tmp_path
+    )
+    status_mock = AsyncMock(
+        side_effect=make_get_page_result_mock(
+            {"user/counter.json": {"instant": ["250 W"], "logged": 1}},
+            default={"status": [1] * 32, "val": [0] * 32},
+        )
+    )
+    set_private_attr(api, "_get_page_result", status_mock)
+
+    devices = await api.get_all_devices()
+
+    assert devices[LIGHT][0].name == "Uscita 7"
+    assert devices[LIGHT][0].status == 1
+    assert devices[OTHER][0].power == pytest.approx(250.0)
+    pages = {call.kwargs["page"] for call in status_mock.await_args_list}
+    assert pages == {"user/icon_status.json", "user/counter.json"}
+
+    # The background check keeps the known objects if nothing changed
+    light = devices[LIGHT][0]
+    light.confirmed = False
+    desc_mock = AsyncMock(side_effect=make_get_page_result_mock(bridge_pages))
+    set_private_attr(api, "_get_page_result", desc_mock)
+    task = get_private_attr(api, "_description_check_task")
+    assert isinstance(task, asyncio.Task)
+    await task
+
+    pages = {call.kwargs["page"] for call in desc_mock.await_args_list}
+    assert pages == {"user/icon_desc.json"}
+    assert devices[LIGHT][0] is light
+    assert light.confirmed is False
+    assert get_private_attr(api, "_devices_from_cache") is False
+    assert get_private_attr(api, "_description_check_pending") is False
+
+
+async def test_get_all_devices_warm_start_failures(
+    mock_session: ClientSession,
+    bridge_pages: dict[str, dict[str, object]],
+    tmp_path: Path,
+) -> None:
+    """Test warm start errors and a failed background check retried on poll."""
+    api = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, description_cache_dir=tmp_path
+    )
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(side_effect=make_get_page_result_mock(bridge_pages)),
+    )
+    await api.get_all_devices()
+
+    api = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, description_cache_dir=tmp_path
+    )
+    set_private_attr(
+        api, "_get_page_result", AsyncMock(return_value=(HTTPStatus.OK, {}))
+    )
+    with pytest.raises(DeviceStorageFailureError):
+        await api.get_all_devices()
+
+    # Statuses are fine, the description check gets an empty reply
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(
+            side_effect=make_get_page_result_mock(
+                {"user/counter.json": {"instant": ["250 W"], "logged": 1}},
+                default={"status": [0] * 32, "val": [0] * 32},
+            )
+        ),
+    )
+    await api.get_all_devices()
+    task = get_private_attr(api, "_description_check_task")
+    assert isinstance(task, asyncio.Task)
+    await task
+    assert get_private_attr(api, "_description_check_pending") is True
+
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(
+            side_effect=make_get_page_result_mock(
+                bridge_pages, default={"status": [0] * 32, "val": [0] * 32}
+            )
+        ),
+    )
+    await api.refresh_status()
+    retry = get_private_attr(api, "_description_check_task")
+    assert isinstance(retry, asyncio.Task)
+    assert retry is not task
+    await retry
+    assert get_private_attr(api, "_description_check_pending") is False
+
+
+async def test_description_check_rebuilds_changed_devices(
+    mock_session: ClientSession,
+    bridge_pages: dict[str, dict[str, object]],
+    tmp_path: Path,
+) -> None:
+    """Test devices are rebuilt when the background check finds a change."""
+    api = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, description_cache_dir=tmp_path
+    )
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(side_effect=make_get_page_result_mock(bridge_pages)),
+    )
+    await api.get_all_devices()
+
+    api = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, description_cache_dir=tmp_path
+    )
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(
+            side_effect=make_get_page_result_mock(
+                bridge_pages, default={"status": [0] * 32, "val": [0] * 32}
+            )
+        ),
+    )
+    devices = await api.get_all_devices()
+    light = devices[LIGHT][0]
+
+    light_desc = dict(bridge_pages["user/icon_desc.json?type=light"])
+    light_desc["desc"] = ["Renamed", *cast("list[str]", light_desc["desc"])[1:]]
+    bridge_pages["user/icon_desc.json?type=light"] = light_desc
+    task = get_private_attr(api, "_description_check_task")
+    assert isinstance(task, asyncio.Task)
+    await task
+
+    assert devices[LIGHT][0] is not light
+    assert devices[LIGHT][0].name == "Renamed"
+
+
 async def test_get_all_devices_empty_payload_raises_storage_error(
     mock_session: ClientSession,
 ) -> None:
@@ -0,0 +1,189 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for snapshot change detection."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from aiocomelit.api import (
+    ComelitDeviceEvent,
+    ComeliteSerialBridgeApi,
+    ComelitSerialBridgeObject,
+    ComelitVedoApi,
+    ComelitVedoZoneEvent,
+    ComelitVedoZoneObject,
+)
+from aiocomelit.changes import ChangeTracker
+from aiocomelit.const import ALARM_AREA, ALARM_ZONE, CLIMATE, LIGHT, AlarmZoneState
+from tests.conftest import set_private_attr, setup_api
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+    from aiocomelit.api import ComelitEvent
+
+
+def _device(index: int, status: int = 0) -> ComelitSerialBridgeObject:
+    """Build a light device."""
+    return ComelitSerialBridgeObject(
+        index=index,
+        name=f"Light {index}",
+        status=status,
+        human_status="on" if status else "off",
+        type=LIGHT,
+        val=0,
+        protected=0,
+        zone="",
+        power=0.0,
+    )
+
+
+def test_change_tracker_reports_changes_only() -> None:
+    """Test only new or changed objects are reported."""
+    tracker = ChangeTracker()
+    devices = {LIGHT: {0: _device(0), 1: _device(1)}}
+
+    assert tracker.update(devices) == devices
+    assert tracker.update(devices) == {}
+
+    # Objects updated in place are detected
+    devices[LIGHT][1].status = 1
+    devices[LIGHT][1].human_status = "on"
+    assert tracker.update(devices) == {LIGHT: {1: devices[LIGHT][1]}}
+
+    # Objects replaced with the same state are not
+    assert tracker.update({LIGHT: {0: _device(0), 1: _device(1, 1)}}) == {}
+
+
+def test_change_tracker_nested_values_and_removal() -> None:
+    """Test nested values are compared by content and removals are forgotten."""
+    tracker = ChangeTracker()
+    clima = _device(0)
+    clima.val = [[220, 1], [0, 0]]
+    tracker.update({CLIMATE: {0: clima}})
+
+    clima.val = [[220, 1], [0, 0]]
+    assert tracker.update({CLIMATE: {0: clima}}) == {}
+    clima.val = [[225, 1], [0, 0]]
+    assert tracker.update({CLIMATE: {0: clima}}) == {CLIMATE: {0: clima}}
+
+    assert tracker.update({CLIMATE: {}}) == {}
+    assert tracker.update({CLIMATE: {0: clima}}) == {CLIMATE: {0: clima}}
+
+    tracker.reset()
+    assert tracker.update({CLIMATE: {0: clima}}) == {CLIMATE: {0: clima}}
+
+
+async def test_get_changed_devices(mock_session: ClientSession) -> None:
+    """Test bridge changed devices are computed from status refreshes."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    devices = {LIGHT: {0: _device(0), 1: _device(1)}}
+    set_private_attr(api, "refresh_status", AsyncMock(return_value=devices))
+
+    assert await api.get_changed_devices() == devices
+    devices[LIGHT][0].status = 1
+    assert await api.get_changed_devices() == {LIGHT: {0: devices[LIGHT][0]}}
+
+
+async def test_get_changed_areas_and_zones(mock_session: ClientSession) -> None:
+    """Test VEDO changed areas and zones are computed from full polls."""
+    api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
+    zone = ComelitVedoZoneObject(
+        index=0,
+        name="Door",
+        status_api="0000",
+        status=0,
+        human_status=AlarmZoneState.REST,
+    )
+    data = {ALARM_AREA: {}, ALARM_ZONE: {0: zone}}
+    set_private_attr(api, "get_all_areas_and_zones", AsyncMock(return_value=data))
+
+    assert await api.get_changed_areas_and_zones() == {ALARM_ZONE: {0: zone}}
+    assert await api.get_changed_areas_and_zones() == {}
+    zone.status = 1
+    zone.human_status = AlarmZoneState.OPEN
+    assert await api.get_changed_areas_and_zones() == {ALARM_ZONE: {0: zone}}
+
+
+async def test_watch_polls_without_overlap(mock_session: ClientSession) -> None:
+    """Test watch yields typed events and polls only once events are consumed."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    polls = 0
+
+    async def fake_refresh() -> dict[str, dict[int, ComelitSerialBridgeObject]]:
+        """Toggle one light on every poll."""
+        nonlocal polls
+        polls += 1
+        return {LIGHT: {0: _device(0, polls % 2), 1: _device(1)}}
+
+    set_private_attr(api, "refresh_status", AsyncMock(side_effect=fake_refresh))
+
+    events: list[ComelitEvent] = []
+    async with aclosing(api.watch(interval=0)) as watcher:
+        async for event in watcher:
+            events.append(event)
+            # Slow consumer: polling must wait for it
+            await asyncio.sleep(0.01)
+            assert polls == max(1, len(events) - 1)
+            if len(events) == 4:
+                break
+
+    assert all(isinstance(event, ComelitDeviceEvent) for event in events)
+    assert [event.device.index for event in events] == [0, 1, 0, 0]
+    assert polls == 3
+
+
+async def test_watch_vedo_events(mock_session: ClientSession) -> None:
+    """Test VEDO watch yields zone events."""
+    api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
+    zone = ComelitVedoZoneObject(
+        index=3,
+        name="Door",
+        status_api="0001",
+        status=1,
+        human_status=AlarmZoneState.OPEN,
+    )
+    set_private_attr(
+        api,
+        "get_all_areas_and_zones",
+        AsyncMock(return_value={ALARM_AREA: {}, ALARM_ZONE: {3: zone}}),
+    )
+
+    async with aclosing(api.watch(interval=0)) as watcher:
+        event = await anext(watcher)
+
+    assert event == ComelitVedoZoneEvent(zone)
+
+
+async def test_watch_bridge_vedo_events(mock_session: ClientSession) -> None:
+    """Test a bridge with VEDO enabled streams device and zone events."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    zone = ComelitVedoZoneObject(
+        index=3,
+        name="Door",
+        status_api="0001",
+        status=1,
+        human_status=AlarmZoneState.OPEN,
+    )
+    set_private_attr(
+        api, "refresh_status", AsyncMock(return_value={LIGHT: {0: _device(0)}})
+    )
+    set_private_attr(
+        api,
+        "get_all_areas_and_zones",
+        AsyncMock(return_value={ALARM_AREA: {}, ALARM_ZONE: {3: zone}}),
+    )
+    set_private_attr(api, "_get_page_result", AsyncMock(return_value=(200, {})))
+
+    assert await api.vedo_enabled("1234") is True
+    async with aclosing(api.watch(interval=0)) as watcher:
+        events = [await anext(watcher), await anext(watcher)]
+    assert events == [
+        ComelitDeviceEvent(LIGHT, _device(0)),
+        ComelitVedoZoneEvent(zone),
+    ]
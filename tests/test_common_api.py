@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from http import HTTPStatus
 from http.cookies import SimpleCookie
 from typing import TYPE_CHECKING, Any
@@ -12,22 +14,17 @@ from unittest.mock import AsyncMock, Mock
 
 import orjson
 import pytest
-from aiohttp import ClientConnectorError, ContentTypeError, RequestInfo
-from multidict import CIMultiDict, CIMultiDictProxy
-from yarl import URL
+from aiohttp import ClientConnectorError, ClientSession
 
 from aiocomelit.api import (
     ComeliteSerialBridgeApi,
     ComelitVedoApi,
-    ComelitVedoAreaObject,
-    ComelitVedoZoneObject,
 )
 from aiocomelit.const import (
     BRIDGE,
+    PRIORITY_ALARM,
     SLEEP_AFTER_VEDO_LOGIN,
     VEDO,
-    AlarmAreaState,
-    AlarmZoneState,
 )
 from aiocomelit.exceptions import (
     CannotAuthenticate,
@@ -45,22 +42,12 @@ from tests.conftest import (
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
-    from aiohttp import ClientSession
-
     GetPageResultMethod = Callable[..., Awaitable[tuple[int, dict[str, Any]]]]
     PostPageResultMethod = Callable[..., Awaitable[tuple[int, SimpleCookie]]]
     CheckLoggedInMethod = Callable[[str], Awaitable[bool]]
     IsSessionActiveMethod = Callable[[], Awaitable[bool]]
     SleepMethod = Callable[[float], Awaitable[None]]
     LoginMethod = Callable[[dict[str, Any], str], Awaitable[bool]]
-    TranslateZoneMethod = Callable[[ComelitVedoZoneObject], Awaitable[AlarmZoneState]]
-    TranslateAreaMethod = Callable[[ComelitVedoAreaObject], Awaitable[AlarmAreaState]]
-    CreateAreaMethod = Callable[
-        [dict[str, Any], dict[str, Any], int], Awaitable[ComelitVedoAreaObject]
-    ]
-    CreateZoneMethod = Callable[
-        [dict[str, Any], dict[str, Any], int], Awaitable[ComelitVedoZoneObject]
-    ]
     AsyncGetPageDataMethod = Callable[
         [str, str, str | int | None], Awaitable[tuple[bool, dict[str, Any]]]
     ]
@@ -84,7 +71,7 @@ async def test_get_page_result_success(
     # Test ignore_missing=True with 404 response
     mock_response = AsyncMock()
     mock_response.status = HTTPStatus.NOT_FOUND
-    mock_response.text = AsyncMock(return_value="empty page")
+    mock_response.read = AsyncMock(return_value=b"empty page")
     set_private_attr(
         api,
         "_session",
@@ -154,14 +141,15 @@ async def test_get_page_result_raises_on_connection_and_status_errors(
         await get_page_result("status.json")
 
 
+@pytest.mark.parametrize("body", [b"bad json", b""])
 async def test_get_page_result_raises_on_json_parsing_errors(
     mock_session: ClientSession,
+    body: bytes,
 ) -> None:
     """Test GET error handling for JSON parsing failures."""
     api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
     get_page_result: GetPageResultMethod = call_private_async(api, "_get_page_result")
 
-    # Test orjson parsing error
     set_private_attr(
         api,
         "_session",
@@ -169,9 +157,7 @@ async def test_get_page_result_raises_on_json_parsing_errors(
             get=AsyncMock(
                 return_value=AsyncMock(
                     status=HTTPStatus.OK,
-                    json=AsyncMock(
-                        side_effect=orjson.JSONDecodeError("bad json", "{}", 0)
-                    ),
+                    read=AsyncMock(return_value=body),
                 )
             )
         ),
@@ -179,32 +165,147 @@ async def test_get_page_result_raises_on_json_parsing_errors(
     with pytest.raises(DeviceStorageFailureError):
         await get_page_result("status.json")
 
-    # Test ContentTypeError
-    set_private_attr(
-        api,
-        "_session",
-        AsyncMock(
-            get=AsyncMock(
-                return_value=AsyncMock(
-                    status=HTTPStatus.OK,
-                    json=AsyncMock(
-                        side_effect=ContentTypeError(
-                            request_info=RequestInfo(
-                                url=URL("http://127.0.0.1"),
-                                method="GET",
-                                headers=CIMultiDictProxy(CIMultiDict()),
-                                real_url=URL("http://127.0.0.1"),
-                            ),
-                            history=(),
-                            message="wrong type",
-                        )
-                    ),
-                )
-            )
-        ),
+
+async def test_get_page_result_reads_body_once(
+    mock_session: ClientSession,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the GET body is read once and decoded for logging only in debug."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    get_page_result: GetPageResultMethod = call_private_async(api, "_get_page_result")
+
+    response = AsyncMock(
+        status=HTTPStatus.OK,
+        read=AsyncMock(return_value=b'{"ok": true}'),
     )
-    with pytest.raises(DeviceStorageFailureError):
+    set_private_attr(api, "_session", AsyncMock(get=AsyncMock(return_value=response)))
+
+    with caplog.at_level(logging.INFO, logger="aiocomelit"):
+        assert await get_page_result("status.json") == (HTTPStatus.OK, {"ok": True})
+    assert "GET response" not in caplog.text
+
+    with caplog.at_level(logging.DEBUG, logger="aiocomelit"):
         await get_page_result("status.json")
+    assert 'GET response {"ok": true}' in caplog.text
+
+    assert response.read.await_count == 2
+    response.text.assert_not_awaited()
+    response.json.assert_not_awaited()
+
+
+async def test_get_page_result_coalesces_identical_queries(
+    mock_session: ClientSession,
+) -> None:
+    """Test concurrent identical GETs share one request and its result."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    get_page_result: GetPageResultMethod = call_private_async(api, "_get_page_result")
+
+    async def fake_get(*_args: object, **_kwargs: object) -> AsyncMock:
+        """Return a response after yielding to the other callers."""
+        await asyncio.sleep(0.01)
+        return AsyncMock(
+            status=HTTPStatus.OK,
+            read=AsyncMock(return_value=b'{"status": [1]}'),
+        )
+
+    get_mock = AsyncMock(side_effect=fake_get)
+    set_private_attr(api, "_session", AsyncMock(get=get_mock))
+
+    query = {"type": "light"}
+    results = await asyncio.gather(
+        *(get_page_result("user/icon_status.json", query) for _ in range(5)),
+        get_page_result("user/icon_status.json", {"type": "shutter"}),
+    )
+
+    assert get_mock.await_count == 2
+    assert all(result is results[0] for result in results[:5])
+    assert results[0] == (HTTPStatus.OK, {"status": [1]})
+    assert get_private_attr(api, "_inflight_requests") == {}
+
+    # Sequential calls and commands are never coalesced
+    await get_page_result("user/icon_status.json", query)
+    await asyncio.gather(
+        *(
+            get_page_result("user/action.cgi", {"num1": 0}, reply_json=False)
+            for _ in range(2)
+        )
+    )
+    assert get_mock.await_count == 5
+
+
+async def test_get_page_result_coalesced_error_reaches_all_callers(
+    mock_session: ClientSession,
+) -> None:
+    """Test a failed shared GET raises for every caller."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    get_page_result: GetPageResultMethod = call_private_async(api, "_get_page_result")
+
+    get_mock = AsyncMock(side_effect=TimeoutError())
+    set_private_attr(api, "_session", AsyncMock(get=get_mock))
+
+    results = await asyncio.gather(
+        *(get_page_result("status.json") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert get_mock.await_count == 1
+    assert all(isinstance(result, CannotConnect) for result in results)
+
+
+async def test_get_page_result_status_cache(
+    mock_session: ClientSession,
+    mock_get_session: Callable[[int, dict[str, Any] | None], AsyncMock],
+) -> None:
+    """Test status pages are cached per TTL and dropped after commands."""
+    api = ComeliteSerialBridgeApi(
+        "127.0.0.1",
+        80,
+        "1234",
+        mock_session,
+        status_cache_ttl={"icon_status.json": 60, "area_stat.json": 60},
+    )
+    get_page_result: GetPageResultMethod = call_private_async(api, "_get_page_result")
+    session = mock_get_session(HTTPStatus.OK, {"status": [1]})
+    set_private_attr(api, "_session", session)
+
+    query = {"type": "light"}
+    await get_page_result("user/icon_status.json", query)
+    await get_page_result("user/icon_status.json", query)
+    await get_page_result("user/vedo_area_stat.json")
+    await get_page_result("user/vedo_area_stat.json")
+    assert session.get.await_count == 2
+
+    # Pages without a TTL are always fetched
+    await get_page_result("user/icon_desc.json", query)
+    await get_page_result("user/icon_desc.json", query)
+    assert session.get.await_count == 4
+
+    assert await api.set_device_status("light", 0, 1) is True
+    await get_page_result("user/icon_status.json", query)
+    assert session.get.await_count == 6
+
+    # A command sent through another instance of the host drops it too
+    await get_page_result("user/icon_status.json", query)
+    assert session.get.await_count == 6
+    other = ComeliteSerialBridgeApi("127.0.0.1", 80, "1234", mock_session)
+    set_private_attr(other, "_session", mock_get_session(HTTPStatus.OK, {}))
+    assert await other.set_device_status("light", 0, 0) is True
+    await get_page_result("user/icon_status.json", query)
+    assert session.get.await_count == 7
+
+
+async def test_status_cache_rejects_unknown_pages(
+    mock_session: ClientSession,
+) -> None:
+    """Test only status pages can be cached."""
+    with pytest.raises(ValueError, match="icon_desc"):
+        ComelitVedoApi(
+            "127.0.0.1",
+            80,
+            "9999",
+            mock_session,
+            status_cache_ttl={"icon_desc.json": 10},
+        )
 
 
 async def test_post_page_result_success_and_errors(
@@ -349,12 +450,6 @@ async def test_login_happy_path_and_failure(mock_session: ClientSession) -> None
     api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
     login_internal: LoginMethod = call_private_async(api, "_login")
 
-    post_mock = AsyncMock()
-    set_private_attr(api, "_check_logged_in", AsyncMock(side_effect=[True]))
-    set_private_attr(api, "_post_page_result", post_mock)
-    assert await login_internal({"dom": "1234"}, BRIDGE) is True
-    post_mock.assert_not_awaited()
-
     set_private_attr(api, "_check_logged_in", AsyncMock(side_effect=[False]))
     set_private_attr(
         api,
@@ -366,7 +461,7 @@ async def test_login_happy_path_and_failure(mock_session: ClientSession) -> None
 
     cookies = SimpleCookie()
     cookies["sid"] = "ok"
-    set_private_attr(api, "_check_logged_in", AsyncMock(side_effect=[False, False]))
+    set_private_attr(api, "_check_logged_in", AsyncMock(side_effect=[False]))
     set_private_attr(
         api,
         "_post_page_result",
@@ -374,6 +469,140 @@ async def test_login_happy_path_and_failure(mock_session: ClientSession) -> None
     )
     assert await login_internal({"dom": "1234"}, BRIDGE) is False
 
+    check_mock = AsyncMock(side_effect=[True])
+    post_mock = AsyncMock(return_value=(HTTPStatus.OK, cookies))
+    set_private_attr(api, "_check_logged_in", check_mock)
+    set_private_attr(api, "_post_page_result", post_mock)
+    assert await login_internal({"dom": "1234"}, BRIDGE) is True
+    post_mock.assert_awaited_once()
+
+
+async def test_bridge_login_renews_expired_session(
+    mock_session: ClientSession,
+) -> None:
+    """Test an active bridge session is checked and renewed once expired."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    cookies = SimpleCookie()
+    cookies["sid"] = "ok"
+    post_mock = AsyncMock(return_value=(HTTPStatus.OK, cookies))
+    set_private_attr(api, "_post_page_result", post_mock)
+    logged_in = {"domus": "AB12CD34EF56"}
+    logged_out = {"domus": "000000000000"}
+    get_mock = AsyncMock(
+        side_effect=[
+            (HTTPStatus.OK, logged_in),  # first login
+            (HTTPStatus.OK, logged_in),  # session still active
+            (HTTPStatus.OK, logged_out),  # session expired
+            (HTTPStatus.OK, logged_in),  # new login
+        ]
+    )
+    set_private_attr(api, "_get_page_result", get_mock)
+
+    assert await api.login() is True
+    assert await api.login() is True
+    post_mock.assert_awaited_once()
+
+    assert await api.login() is True
+    assert post_mock.await_count == 2
+    pages = [call.args[0] for call in get_mock.await_args_list]
+    assert pages == ["login.json"] * 4
+
+
+async def test_bridge_empty_reply_triggers_relogin(
+    mock_session: ClientSession,
+) -> None:
+    """Test an empty bridge reply is handled as an expired session."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    cookies = SimpleCookie()
+    cookies["sid"] = "ok"
+    post_mock = AsyncMock(return_value=(HTTPStatus.OK, cookies))
+    set_private_attr(api, "_post_page_result", post_mock)
+    set_private_attr(api, "_check_logged_in", AsyncMock(return_value=True))
+    assert await api.login() is True
+
+    fetch_mock = AsyncMock(
+        side_effect=[(HTTPStatus.OK, {}), (HTTPStatus.OK, {"status": [1]})]
+    )
+    set_private_attr(api, "_fetch_page_result", fetch_mock)
+
+    assert await api.get_device_status("light", 0) == 1
+    assert post_mock.await_count == 2
+
+
+async def test_expired_session_triggers_single_relogin(
+    mock_session: ClientSession,
+) -> None:
+    """Test a logged out reply logs in again and retries the query once."""
+    api = setup_api(ComeliteSerialBridgeApi, "127.0.0.1", 80, "1234", mock_session)
+    cookies = SimpleCookie()
+    cookies["sid"] = "ok"
+    post_mock = AsyncMock(return_value=(HTTPStatus.OK, cookies))
+    set_private_attr(api, "_post_page_result", post_mock)
+    set_private_attr(api, "_check_logged_in", AsyncMock(return_value=True))
+    assert await api.login() is True
+    post_mock.reset_mock()
+
+    logged_out = {"logged": 0, "domus": "000000000000"}
+    replies = [logged_out] * 3 + [{"logged": 1, "status": [1]}] * 3
+    fetch_mock = AsyncMock(
+        side_effect=[(HTTPStatus.OK, reply) for reply in replies],
+    )
+    set_private_attr(api, "_fetch_page_result", fetch_mock)
+
+    results = await asyncio.gather(
+        *(
+            api.get_device_status(dev_type, 0)
+            for dev_type in ("light", "shutter", "other")
+        )
+    )
+
+    assert results == [1, 1, 1]
+    post_mock.assert_awaited_once_with(
+        "login.cgi", {"dom": "1234"}, priority=PRIORITY_ALARM
+    )
+    assert fetch_mock.await_count == len(replies)
+
+    # Without stored credentials the logged out reply is returned as is
+    await api.logout()
+    fetch_mock = AsyncMock(return_value=(HTTPStatus.OK, logged_out))
+    set_private_attr(api, "_fetch_page_result", fetch_mock)
+    _, reply = await call_private_async(api, "_get_page_result")("user/counter.json")
+    assert reply == logged_out
+    fetch_mock.assert_awaited_once()
+
+
+async def test_export_and_import_session(mock_session: ClientSession) -> None:
+    """Test a session exported by one API instance is reused by another."""
+    api = setup_api(ComelitVedoApi, "vedo.local", 80, "9999", mock_session)
+    cookies = SimpleCookie()
+    cookies["sid"] = "ok"
+    set_private_attr(
+        api, "_post_page_result", AsyncMock(return_value=(HTTPStatus.OK, cookies))
+    )
+    set_private_attr(api, "_check_logged_in", AsyncMock(return_value=True))
+    set_private_attr(api, "_check_new_firmware", AsyncMock(return_value=True))
+    set_private_attr(api, "_rate_limiter", Mock())
+    assert await api.login() is True
+
+    data = orjson.loads(orjson.dumps(api.export_session()))
+    assert data["cookies"] == {"sid": "ok"}
+    assert data["new_firmware"] is True
+
+    async with ClientSession() as session:
+        restored = setup_api(ComelitVedoApi, "vedo.local", 80, "9999", session)
+        other = setup_api(ComelitVedoApi, "vedo.local", 8080, "9999", session)
+        assert other.import_session(data) is False
+        assert restored.import_session(data, max_age=-1) is False
+        assert restored.import_session(data) is True
+
+        post_mock = AsyncMock()
+        set_private_attr(restored, "_post_page_result", post_mock)
+        assert await restored.login() is True
+        post_mock.assert_not_awaited()
+        assert get_private_attr(restored, "_is_new_firmware") is True
+        jar = session.cookie_jar.filter_cookies(restored.base_url)
+        assert jar["sid"].value == "ok"
+
 
 @pytest.mark.parametrize(
     ("new_firmware", "login_data"),
@@ -391,15 +620,15 @@ async def test_login_vedo_firmwares(
 
     cookies = SimpleCookie()
     cookies["sid"] = "ok"
-    sleep_mock = AsyncMock()
+    limiter_mock = Mock()
 
-    set_private_attr(api, "_check_logged_in", AsyncMock(side_effect=[False, True]))
+    set_private_attr(api, "_check_logged_in", AsyncMock(side_effect=[True]))
     set_private_attr(
         api,
         "_post_page_result",
         AsyncMock(return_value=(HTTPStatus.OK, cookies)),
     )
-    set_private_attr(api, "_sleep_between_call", sleep_mock)
+    set_private_attr(api, "_rate_limiter", limiter_mock)
     set_private_attr(
         api,
         "_get_page_result",
@@ -407,130 +636,10 @@ async def test_login_vedo_firmwares(
     )
 
     assert await login_internal({"code": "9999"}, VEDO) is True
-    sleep_mock.assert_awaited_once_with(SLEEP_AFTER_VEDO_LOGIN)
+    limiter_mock.pause.assert_called_once_with(SLEEP_AFTER_VEDO_LOGIN)
     assert get_private_attr(api, "_is_new_firmware") is new_firmware
 
 
-@pytest.mark.parametrize(
-    ("zone_status", "expected"),
-    [
-        (2, AlarmZoneState.ALARM),
-        (1, AlarmZoneState.OPEN),
-        (4, AlarmZoneState.FAULTY),
-        (8, AlarmZoneState.SABOTATED),
-        (32, AlarmZoneState.ARMED),
-        (128, AlarmZoneState.EXCLUDED),
-        (256, AlarmZoneState.ISOLATED),
-        (512, AlarmZoneState.UNAVAILABLE),
-        (32768, AlarmZoneState.INHIBITED),
-        (0, AlarmZoneState.REST),
-        (99999, AlarmZoneState.ALARM),
-    ],
-)
-async def test_translate_zone_status(
-    mock_session: ClientSession,
-    zone_status: int,
-    expected: AlarmZoneState,
-) -> None:
-    """Test zone status translations."""
-    api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
-    translate_zone_status: TranslateZoneMethod = call_private_async(
-        api, "_translate_zone_status"
-    )
-    zone = ComelitVedoZoneObject(
-        index=0,
-        name="Zone",
-        status_api=f"{zone_status:04x}",
-        status=zone_status,
-        human_status=AlarmZoneState.UNKNOWN,
-    )
-
-    assert await translate_zone_status(zone) == expected
-
-
-@pytest.mark.parametrize(
-    ("area_updates", "expected"),
-    [
-        ({"out_time": True}, AlarmAreaState.EXIT_DELAY),
-        ({"in_time": True}, AlarmAreaState.ENTRY_DELAY),
-        ({"sabotage": True}, AlarmAreaState.SABOTAGE),
-        ({"alarm": True, "armed": 1}, AlarmAreaState.TRIGGERED),
-        ({"armed": 1}, AlarmAreaState.ARMED),
-        ({"ready": True}, AlarmAreaState.DISARMED),
-        ({}, AlarmAreaState.DISARMED),
-    ],
-)
-async def test_translate_area_status(
-    mock_session: ClientSession,
-    area_updates: dict[str, bool | int],
-    expected: AlarmAreaState,
-) -> None:
-    """Test area status translations."""
-    api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
-    translate_area_status: TranslateAreaMethod = call_private_async(
-        api, "_translate_area_status"
-    )
-    area = ComelitVedoAreaObject(
-        index=0,
-        name="Area",
-        p1=False,
-        p2=False,
-        ready=False,
-        armed=0,
-        alarm=False,
-        alarm_memory=False,
-        sabotage=False,
-        anomaly=False,
-        in_time=False,
-        out_time=False,
-        human_status=AlarmAreaState.UNKNOWN,
-    )
-    for key, value in area_updates.items():
-        setattr(area, key, value)
-
-    assert await translate_area_status(area) == expected
-
-
-async def test_create_area_and_zone_objects(mock_session: ClientSession) -> None:
-    """Test creation of area and zone objects."""
-    api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
-    create_area_object: CreateAreaMethod = call_private_async(
-        api, "_create_area_object"
-    )
-    create_zone_object: CreateZoneMethod = call_private_async(
-        api, "_create_zone_object"
-    )
-
-    area = await create_area_object(
-        {
-            "description": ["Perimeter"],
-            "p1_pres": [False],
-            "p2_pres": [True],
-        },
-        {
-            "ready": [True],
-            "armed": [0],
-            "alarm": [False],
-            "alarm_memory": [False],
-            "sabotage": [False],
-            "anomaly": [False],
-            "in_time": [False],
-            "out_time": [False],
-        },
-        0,
-    )
-    assert area.name == "Perimeter"
-    assert area.human_status == AlarmAreaState.DISARMED
-
-    zone = await create_zone_object(
-        {"description": ["Front Door"]},
-        {"status": "0020"},
-        0,
-    )
-    assert zone.status == int("0x20", 16)
-    assert zone.human_status == AlarmZoneState.ARMED
-
-
 async def test_async_get_page_data_present_check(mock_session: ClientSession) -> None:
     """Test async page data helper present-check behavior."""
     api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
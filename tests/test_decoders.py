@@ -0,0 +1,251 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for VEDO status decoders."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from aiocomelit.const import (
+    ALARM_AREA_STATUS,
+    ALARM_ZONE_STATUS,
+    AlarmAreaState,
+    AlarmZoneState,
+)
+from aiocomelit.decoders import (
+    area_state,
+    decode_area_states,
+    decode_areas,
+    decode_zone_statuses,
+    decode_zones,
+    zone_state,
+)
+from aiocomelit.exceptions import CannotRetrieveData
+from aiocomelit.models import ComelitVedoAreaObject, ComelitVedoZoneObject
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _reference_zone_state(status: int) -> AlarmZoneState:
+    """Translate a zone status by scanning every flag."""
+    for flag in ALARM_ZONE_STATUS:
+        if status & flag != 0:
+            return ALARM_ZONE_STATUS[flag]
+    return AlarmZoneState.REST
+
+
+def test_zone_state_table_matches_flag_scan() -> None:
+    """Test the lookup table agrees with a flag scan for every 16-bit status."""
+    assert all(
+        zone_state(status) is _reference_zone_state(status) for status in range(1 << 16)
+    )
+
+
+def test_decode_zone_statuses(
+    fixture_loader: Callable[[str], dict[str, object]],
+) -> None:
+    """Test a zone_stat status string is decoded by zone index."""
+    status = str(fixture_loader("vedo/zone_stat")["status"])
+
+    decoded = decode_zone_statuses(status)
+
+    assert len(decoded) == len(status.split(","))
+    assert decoded[0] == ("0200", 0x200, AlarmZoneState.UNAVAILABLE)
+    assert decoded[2] == ("0020", 0x20, AlarmZoneState.ARMED)
+    assert decoded[12] == ("8001", 0x8001, AlarmZoneState.OPEN)
+    assert decode_zone_statuses("8000,0000") == [
+        ("8000", 0x8000, AlarmZoneState.INHIBITED),
+        ("0000", 0, AlarmZoneState.REST),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("zone_status", "expected"),
+    [
+        (2, AlarmZoneState.ALARM),
+        (1, AlarmZoneState.OPEN),
+        (4, AlarmZoneState.FAULTY),
+        (8, AlarmZoneState.SABOTATED),
+        (32, AlarmZoneState.ARMED),
+        (128, AlarmZoneState.EXCLUDED),
+        (256, AlarmZoneState.ISOLATED),
+        (512, AlarmZoneState.UNAVAILABLE),
+        (32768, AlarmZoneState.INHIBITED),
+        (0, AlarmZoneState.REST),
+        (99999, AlarmZoneState.ALARM),
+    ],
+)
+def test_zone_state(zone_status: int, expected: AlarmZoneState) -> None:
+    """Test zone status translations."""
+    assert zone_state(zone_status) == expected
+
+
+@pytest.mark.parametrize(
+    ("area_updates", "expected"),
+    [
+        ({"out_time": True}, AlarmAreaState.EXIT_DELAY),
+        ({"in_time": True}, AlarmAreaState.ENTRY_DELAY),
+        ({"sabotage": True}, AlarmAreaState.SABOTAGE),
+        ({"alarm": True, "armed": 1}, AlarmAreaState.TRIGGERED),
+        ({"armed": 1}, AlarmAreaState.ARMED),
+        ({"ready": True}, AlarmAreaState.DISARMED),
+        ({}, AlarmAreaState.DISARMED),
+    ],
+)
+def test_area_state(
+    area_updates: dict[str, bool | int], expected: AlarmAreaState
+) -> None:
+    """Test area status translations."""
+    flags = dict.fromkeys(ALARM_AREA_STATUS, False) | area_updates
+
+    assert area_state(tuple(flags[field] for field in ALARM_AREA_STATUS)) == expected
+
+
+def _reference_area(
+    json_area_desc: dict[str, Any], json_area_stat: dict[str, Any], index: int
+) -> ComelitVedoAreaObject:
+    """Build one area by indexing every column."""
+    area = ComelitVedoAreaObject(
+        index=index,
+        name=json_area_desc["description"][index],
+        p1=json_area_desc["p1_pres"][index],
+        p2=json_area_desc["p2_pres"][index],
+        ready=json_area_stat["ready"][index],
+        armed=json_area_stat["armed"][index],
+        alarm=json_area_stat["alarm"][index],
+        alarm_memory=json_area_stat["alarm_memory"][index],
+        sabotage=json_area_stat["sabotage"][index],
+        anomaly=json_area_stat["anomaly"][index],
+        in_time=json_area_stat["in_time"][index],
+        out_time=json_area_stat["out_time"][index],
+        human_status=AlarmAreaState.UNKNOWN,
+    )
+    area.human_status = area_state(
+        tuple(getattr(area, field) for field in ALARM_AREA_STATUS)
+    )
+    return area
+
+
+def _reference_zone(
+    json_zone_desc: dict[str, Any], json_zone_stat: dict[str, Any], index: int
+) -> ComelitVedoZoneObject:
+    """Build one zone by indexing every column."""
+    status_api = json_zone_stat["status"].split(",")[index]
+    return ComelitVedoZoneObject(
+        index=index,
+        name=json_zone_desc["description"][index],
+        status=int(status_api, 16),
+        status_api=status_api,
+        human_status=_reference_zone_state(int(status_api, 16)),
+    )
+
+
+@pytest.mark.parametrize("prefix", ["", "vedo_"])
+def test_decode_areas_and_zones_match_per_index_path(
+    fixture_loader: Callable[[str], dict[str, Any]],
+    prefix: str,
+) -> None:
+    """Test the one-pass decoders build the same objects as indexing each column."""
+    area_desc = fixture_loader(f"vedo/{prefix}area_desc")
+    area_stat = fixture_loader(f"vedo/{prefix}area_stat")
+    zone_desc = fixture_loader(f"vedo/{prefix}zone_desc")
+    zone_stat = fixture_loader(f"vedo/{prefix}zone_stat")
+
+    assert decode_areas(area_desc, area_stat) == {
+        index: _reference_area(area_desc, area_stat, index)
+        for index, present in enumerate(area_desc["present"])
+        if present
+    }
+    assert decode_zones(zone_desc, zone_stat) == {
+        index: _reference_zone(zone_desc, zone_stat, index)
+        for index, present in enumerate(zone_desc["present"])
+        if int(present)
+    }
+
+
+def test_decode_areas_and_zones_objects() -> None:
+    """Test creation of area and zone objects."""
+    areas = decode_areas(
+        {
+            "present": [1],
+            "description": ["Perimeter"],
+            "p1_pres": [False],
+            "p2_pres": [True],
+        },
+        {
+            "ready": [True],
+            "armed": [0],
+            "alarm": [False],
+            "alarm_memory": [False],
+            "sabotage": [False],
+            "anomaly": [False],
+            "in_time": [False],
+            "out_time": [False],
+        },
+    )
+    assert areas[0].name == "Perimeter"
+    assert areas[0].human_status == AlarmAreaState.DISARMED
+
+    zones = decode_zones(
+        {"present": ["1"], "description": ["Front Door"]},
+        {"status": "0020"},
+    )
+    assert zones[0].status == int("0x20", 16)
+    assert zones[0].human_status == AlarmZoneState.ARMED
+
+
+def test_decode_areas_and_zones_reject_mismatched_columns() -> None:
+    """Test descriptions and statuses of different lengths are not truncated."""
+    area_desc = {
+        "present": [1, 1],
+        "description": ["Perimeter", "Garage"],
+        "p1_pres": [0, 0],
+        "p2_pres": [0, 0],
+    }
+    with pytest.raises(CannotRetrieveData):
+        decode_areas(
+            area_desc,
+            {
+                field: [0]
+                for field in (
+                    "ready",
+                    "armed",
+                    "alarm",
+                    "alarm_memory",
+                    "sabotage",
+                    "anomaly",
+                    "in_time",
+                    "out_time",
+                )
+            },
+        )
+    with pytest.raises(CannotRetrieveData):
+        decode_zones(
+            {"present": ["1", "1"], "description": ["Front Door", "Garage"]},
+            {"status": "0020"},
+        )
+    with pytest.raises(CannotRetrieveData):
+        decode_area_states(
+            {field: [0, 0] for field in ALARM_AREA_STATUS} | {"armed": [0]}
+        )
+
+
+@pytest.mark.parametrize(
+    ("flags", "expected"),
+    [
+        ({"armed": 4, "ready": 10}, AlarmAreaState.ARMED),
+        ({"armed": 4, "alarm": 1}, AlarmAreaState.TRIGGERED),
+        ({"out_time": 1, "armed": 4}, AlarmAreaState.EXIT_DELAY),
+        ({"ready": 1}, AlarmAreaState.DISARMED),
+        ({}, AlarmAreaState.DISARMED),
+    ],
+)
+def test_decode_area_states(flags: dict[str, int], expected: AlarmAreaState) -> None:
+    """Test area states follow the ALARM_AREA_STATUS flag order."""
+    area_stat = {field: [flags.get(field, 0)] for field in ALARM_AREA_STATUS}
+
+    assert decode_area_states(area_stat) == [expected]
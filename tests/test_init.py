@@ -10,6 +10,7 @@ from aiocomelit.api import (
     ComelitVedoAreaObject,
     ComelitVedoZoneObject,
 )
+from aiocomelit.const import AlarmZoneState
 from aiocomelit.exceptions import (
     CannotAuthenticate,
     CannotConnect,
@@ -31,3 +32,22 @@ def test_objects_can_be_imported() -> None:
     assert type(CannotAuthenticate)
     assert type(CannotRetrieveData)
     assert type(DeviceStorageFailureError)
+
+
+def test_models_are_slotted() -> None:
+    """Verify model instances don't carry a __dict__."""
+    zone = ComelitVedoZoneObject(
+        index=0,
+        name="Zone",
+        status_api="0000",
+        status=0,
+        human_status=AlarmZoneState.REST,
+    )
+
+    assert not hasattr(zone, "__dict__")
+    for model in (
+        ComelitSerialBridgeObject,
+        ComelitVedoAreaObject,
+        ComelitVedoZoneObject,
+    ):
+        assert "__slots__" in vars(model)
@@ -0,0 +1,252 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for request pacing."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiocomelit.api import ComeliteSerialBridgeApi, ComelitVedoApi
+from aiocomelit.const import (
+    PRIORITY_ALARM,
+    PRIORITY_CLIMATE,
+    PRIORITY_DEVICE,
+    PRIORITY_POLL,
+    SLEEP_BETWEEN_VEDO_CALLS,
+)
+from aiocomelit.exceptions import CannotConnect
+from aiocomelit.limiter import PriorityScheduler, RateLimiter
+from tests.conftest import call_private_async, get_private_attr, set_private_attr
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from aiohttp import ClientSession
+    from yarl import URL
+
+    GetPageResultMethod = Callable[..., Awaitable[tuple[int, dict[str, Any]]]]
+
+
+async def _timed_acquires(limiter: RateLimiter, count: int) -> list[float]:
+    """Acquire the limiter several times and return the elapsed times."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    elapsed: list[float] = []
+    for _ in range(count):
+        await limiter.acquire()
+        elapsed.append(loop.time() - start)
+    return elapsed
+
+
+async def test_rate_limiter_unlimited_and_pause() -> None:
+    """Test an unlimited limiter only waits while paused."""
+    limiter = RateLimiter()
+
+    elapsed = await _timed_acquires(limiter, 5)
+    assert elapsed[-1] < 0.01
+
+    limiter.pause(0.05)
+    elapsed = await _timed_acquires(limiter, 1)
+    assert elapsed[0] >= 0.04
+
+
+async def test_rate_limiter_token_bucket() -> None:
+    """Test burst requests pass at once and the rest are paced."""
+    limiter = RateLimiter(50, burst=2)
+
+    elapsed = await _timed_acquires(limiter, 4)
+
+    assert elapsed[1] < 0.01
+    assert elapsed[2] >= 0.015
+    assert elapsed[3] >= 0.035
+
+
+async def test_rate_limiter_adaptive() -> None:
+    """Test adaptive mode slows down on trouble and recovers when healthy."""
+    limiter = RateLimiter(10, adaptive=True, min_rate=2, slow_response=1)
+
+    limiter.record_failure()
+    assert limiter.rate == 5
+    limiter.record_success(1.5)
+    assert limiter.rate == 2.5
+    limiter.record_failure()
+    assert limiter.rate == 2
+
+    for _ in range(20):
+        limiter.record_success(0.1)
+    assert limiter.rate == 10
+
+
+async def test_rate_limiter_static_ignores_feedback() -> None:
+    """Test a non adaptive limiter keeps its rate."""
+    limiter = RateLimiter(10)
+
+    limiter.record_failure()
+    limiter.record_success(10)
+
+    assert limiter.rate == 10
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"rate": 0}, "rate"),
+        ({"rate": 1, "burst": 0}, "burst"),
+        ({"adaptive": True}, "adaptive"),
+    ],
+)
+async def test_rate_limiter_invalid_settings(
+    kwargs: dict[str, Any],
+    match: str,
+) -> None:
+    """Test invalid limiter settings are rejected."""
+    with pytest.raises(ValueError, match=match):
+        RateLimiter(**kwargs)
+
+
+async def test_api_default_rate_limits(mock_session: ClientSession) -> None:
+    """Test each host type gets its default limiter unless one is given."""
+    bridge = ComeliteSerialBridgeApi("127.0.0.1", 80, "1234", mock_session)
+    vedo = ComelitVedoApi("127.0.0.1", 80, "9999", mock_session)
+    limiter = RateLimiter(1)
+    custom = ComelitVedoApi("127.0.0.1", 80, "9999", mock_session, rate_limiter=limiter)
+
+    assert get_private_attr(bridge, "_rate_limiter").rate is None
+    assert get_private_attr(vedo, "_rate_limiter").rate == 1 / SLEEP_BETWEEN_VEDO_CALLS
+    assert get_private_attr(custom, "_rate_limiter") is limiter
+
+
+async def test_api_rate_limiters_shared_per_host(mock_session: ClientSession) -> None:
+    """Test instances of a host share limiters, VEDO pages keep the VEDO one."""
+    bridge = ComeliteSerialBridgeApi("127.0.0.1", 80, "1234", mock_session)
+    other_bridge = ComeliteSerialBridgeApi("127.0.0.1", 80, "1234", mock_session)
+    remote_bridge = ComeliteSerialBridgeApi("127.0.0.2", 80, "1234", mock_session)
+    vedo = ComelitVedoApi("127.0.0.1", 8080, "9999", mock_session)
+    page_rate_limiter = cast(
+        "Callable[[str], RateLimiter]", get_private_attr(bridge, "_page_rate_limiter")
+    )
+    vedo_page_rate_limiter = cast(
+        "Callable[[str], RateLimiter]", get_private_attr(vedo, "_page_rate_limiter")
+    )
+
+    bridge_limiter = page_rate_limiter("user/icon_status.json")
+    vedo_limiter = page_rate_limiter("user/vedo_area_stat.json")
+    assert bridge_limiter.rate is None
+    assert vedo_limiter.rate == 1 / SLEEP_BETWEEN_VEDO_CALLS
+    assert get_private_attr(other_bridge, "_rate_limiter") is bridge_limiter
+    assert get_private_attr(remote_bridge, "_rate_limiter") is not bridge_limiter
+    assert vedo_page_rate_limiter("user/area_stat.json") is not vedo_limiter
+
+
+async def test_api_schedulers_shared_per_host(mock_session: ClientSession) -> None:
+    """Test instances of a host share one scheduler with the lowest limit."""
+    bridge = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, max_concurrent_requests=3
+    )
+    other_bridge = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, max_concurrent_requests=2
+    )
+    remote_bridge = ComeliteSerialBridgeApi("127.0.0.2", 80, "1234", mock_session)
+
+    scheduler = cast("PriorityScheduler", get_private_attr(bridge, "_scheduler"))
+    assert get_private_attr(other_bridge, "_scheduler") is scheduler
+    assert get_private_attr(remote_bridge, "_scheduler") is not scheduler
+    assert scheduler.max_concurrent == 2
+
+
+async def test_get_page_result_feeds_rate_limiter(
+    mock_session: ClientSession,
+    mock_get_session: Callable[[int, dict[str, Any] | None], AsyncMock],
+) -> None:
+    """Test requests acquire the limiter and report their outcome."""
+    limiter = RateLimiter(10, adaptive=True)
+    api = ComeliteSerialBridgeApi(
+        "127.0.0.1", 80, "1234", mock_session, rate_limiter=limiter
+    )
+    get_page_result: GetPageResultMethod = call_private_async(api, "_get_page_result")
+
+    set_private_attr(
+        api,
+        "_session",
+        AsyncMock(get=AsyncMock(side_effect=TimeoutError())),
+    )
+    with pytest.raises(CannotConnect):
+        await get_page_result("status.json")
+    assert limiter.rate == 5
+
+    set_private_attr(api, "_session", mock_get_session(HTTPStatus.OK, {"ok": True}))
+    await get_page_result("status.json")
+    assert limiter.rate == 6
+
+
+async def test_priority_scheduler_orders_waiters() -> None:
+    """Test waiting requests get free slots by priority, then arrival."""
+    scheduler = PriorityScheduler(2)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def request(name: str, priority: int) -> None:
+        """Hold a slot until released, recording when it was granted."""
+        async with scheduler.slot(priority):
+            order.append(name)
+            await release.wait()
+
+    tasks = [
+        asyncio.create_task(request(name, priority))
+        for name, priority in (
+            ("poll1", PRIORITY_POLL),
+            ("poll2", PRIORITY_POLL),
+            ("poll3", PRIORITY_POLL),
+            ("climate", PRIORITY_CLIMATE),
+            ("cancelled", PRIORITY_ALARM),
+            ("light", PRIORITY_DEVICE),
+            ("alarm", PRIORITY_ALARM),
+        )
+    ]
+    await asyncio.sleep(0)
+    tasks[4].cancel()
+    await asyncio.sleep(0)
+    assert order == ["poll1", "poll2"]
+
+    release.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert order == ["poll1", "poll2", "alarm", "light", "climate", "poll3"]
+
+
+async def test_commands_sent_before_polling(mock_session: ClientSession) -> None:
+    """Test a device command overtakes queued status polls."""
+    api = ComeliteSerialBridgeApi("127.0.0.1", 80, "1234", mock_session)
+    sent: list[str] = []
+
+    async def fake_get(url: URL, **_kwargs: object) -> AsyncMock:
+        """Record the requested pages."""
+        sent.append("command" if "num1" in url.query else url.query["type"])
+        await asyncio.sleep(0.01)
+        return AsyncMock(
+            status=HTTPStatus.OK, read=AsyncMock(return_value=b'{"status": [1]}')
+        )
+
+    set_private_attr(api, "_session", AsyncMock(get=fake_get))
+    polls = [
+        asyncio.create_task(api.get_device_status(dev_type, 0))
+        for dev_type in ("light", "shutter", "other")
+    ]
+    # Let the polls reach the scheduler, the first one is in flight
+    await asyncio.sleep(0.005)
+    assert await api.set_device_status("light", 0, 1) is True
+    await asyncio.gather(*polls)
+
+    assert sent == ["light", "command", "shutter", "other"]
+
+
+async def test_priority_scheduler_invalid_settings() -> None:
+    """Test the scheduler rejects an empty request limit."""
+    with pytest.raises(ValueError, match="max_concurrent"):
+        PriorityScheduler(0)
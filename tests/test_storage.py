@@ -0,0 +1,107 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the description cache and the payload store."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import orjson
+
+from aiocomelit.storage import DescriptionCache, PayloadStore, fingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_PAYLOAD = {"num": 1, "desc": ["Light"], "status": [0], "logged": 1}
+
+
+def test_description_cache_round_trip(tmp_path: Path) -> None:
+    """Test stored pages are loaded back by a new cache for the same host."""
+    cache = DescriptionCache(tmp_path, "127.0.0.1", 80)
+    assert cache.get("page") is None
+
+    assert cache.set("page", _PAYLOAD) is True
+    cache.save()
+
+    assert DescriptionCache(tmp_path, "127.0.0.1", 80).get("page") == _PAYLOAD
+    assert DescriptionCache(tmp_path, "127.0.0.1", 8080).get("page") is None
+
+
+def test_description_cache_ignores_volatile_keys(tmp_path: Path) -> None:
+    """Test a status change doesn't count as a description change."""
+    cache = DescriptionCache(tmp_path, "127.0.0.1", 80)
+    cache.set("page", _PAYLOAD)
+    cache.save()
+    mtime = cache.path.stat().st_mtime_ns
+
+    assert cache.set("page", {**_PAYLOAD, "status": [1], "logged": 0}) is False
+    cache.save()
+    assert cache.path.stat().st_mtime_ns == mtime
+
+    assert cache.set("page", {**_PAYLOAD, "desc": ["Lamp"]}) is True
+
+
+def test_description_cache_ignores_bad_files(tmp_path: Path) -> None:
+    """Test corrupted, tampered or foreign cache files are ignored."""
+    cache = DescriptionCache(tmp_path, "127.0.0.1", 80)
+    path = cache.path
+
+    path.write_bytes(b"not json")
+    assert DescriptionCache(tmp_path, "127.0.0.1", 80).get("page") is None
+
+    entries = {"page": {"fingerprint": "bad", "payload": _PAYLOAD}}
+    path.write_bytes(
+        orjson.dumps({"host": "127.0.0.1", "port": 80, "entries": entries})
+    )
+    assert DescriptionCache(tmp_path, "127.0.0.1", 80).get("page") is None
+
+    entries["page"]["fingerprint"] = fingerprint(_PAYLOAD)
+    path.write_bytes(orjson.dumps({"host": "10.0.0.1", "port": 80, "entries": entries}))
+    assert DescriptionCache(tmp_path, "127.0.0.1", 80).get("page") is None
+
+
+def test_description_cache_invalidate(tmp_path: Path) -> None:
+    """Test invalidated pages are dropped from memory and from disk."""
+    cache = DescriptionCache(tmp_path, "127.0.0.1", 80)
+    cache.set("page", _PAYLOAD)
+    cache.set("other", _PAYLOAD)
+    cache.save()
+
+    cache.invalidate("page", "missing")
+    assert cache.get("page") is None
+    cache.save()
+
+    loaded = DescriptionCache(tmp_path, "127.0.0.1", 80)
+    assert loaded.get("page") is None
+    assert loaded.get("other") == _PAYLOAD
+
+
+def test_payload_store_keeps_one_version_per_page() -> None:
+    """Test the store replaces payloads and versions content changes."""
+    store = PayloadStore()
+    assert store.get("user/area_stat.json") == {}
+    assert store.version("user/area_stat.json") == 0
+
+    assert store.set("user/area_stat.json", {"armed": [0]}) is True
+    assert store.set("user/area_stat.json", {"armed": [0]}) is False
+    assert store.version("user/area_stat.json") == 1
+    assert store.set("user/area_stat.json", {"armed": [1]}) is True
+    assert store.version("user/area_stat.json") == 2
+    assert store.get("user/area_stat.json") == {"armed": [1]}
+    assert len(store) == 1
+
+
+def test_payload_store_invalidate() -> None:
+    """Test pages are dropped one by one or all at once."""
+    store = PayloadStore()
+    store.set("user/area_desc.json", _PAYLOAD)
+    store.set("user/area_stat.json", {"armed": [0]})
+
+    store.invalidate("user/area_desc.json", "user/missing.json")
+    assert "user/area_desc.json" not in store
+    assert "user/area_stat.json" in store
+
+    store.invalidate()
+    assert len(store) == 0
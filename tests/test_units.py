@@ -0,0 +1,58 @@
+# Copyright 2023 Simone Chemelli and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for power unit handling."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aiocomelit.units import (
+    async_get_unit_registry,
+    async_parse_power,
+    get_unit_registry,
+    parse_power,
+    parse_power_fast,
+)
+
+
+async def test_unit_registry_is_shared() -> None:
+    """Test the unit registry is created once and shared."""
+    registries = await asyncio.gather(
+        *(async_get_unit_registry() for _ in range(5)),
+    )
+
+    assert all(ureg is registries[0] for ureg in registries)
+    assert get_unit_registry() is registries[0]
+    assert registries[0].formatter.default_format == "~"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("", 0.0),
+        ("5", 0.0),
+        ("0 W", 0.0),
+        ("123 W", 123.0),
+        ("12W", 12.0),
+        ("1.2 kW", 1200.0),
+        ("0.5 MW", 500000.0),
+        ("3 mW", 0.003),
+        ("1e3 W", 1000.0),
+    ],
+)
+def test_parse_power_fast_matches_pint(value: str, expected: float) -> None:
+    """Test the fast power parser agrees with pint on common values."""
+    power = parse_power_fast(value)
+
+    assert power == pytest.approx(expected)
+    assert power == pytest.approx(parse_power(get_unit_registry(), value))
+
+
+@pytest.mark.parametrize("value", ["1 hp", "2 kilowatt", "1,2 kW"])
+async def test_async_parse_power_falls_back_to_pint(value: str) -> None:
+    """Test unknown power formats are delegated to pint."""
+    assert parse_power_fast(value) is None
+    assert await async_parse_power(value) == parse_power(get_unit_registry(), value)
@@ -5,11 +5,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import tracemalloc
 from http import HTTPStatus
 from http.cookies import SimpleCookie
 from typing import TYPE_CHECKING, Any, cast
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
+import orjson
 import pytest
 
 from aiocomelit.api import ComelitVedoApi, ComelitVedoAreaObject
@@ -21,19 +25,23 @@ from aiocomelit.const import (
     AlarmAreaState,
 )
 from aiocomelit.exceptions import CannotRetrieveData
+from aiocomelit.limiter import RateLimiter
 from tests.conftest import (
     call_private_async,
     get_private_attr,
     set_private_attr,
-    set_private_mapping_item,
     setup_api,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
+    from pathlib import Path
 
     LoginMethod = Callable[[dict[str, Any], str], Awaitable[bool]]
     from aiohttp import ClientSession
+    from yarl import URL
+
+    from aiocomelit.storage import DescriptionCache, PayloadStore
 
 AREA_COUNT = 4
 
@@ -95,20 +103,20 @@ async def test_set_zone_status_success_and_failure(
 
     cookies = SimpleCookie()
     cookies["sid"] = "ok"
-    sleep_mock = AsyncMock()
+    limiter_mock = Mock()
 
-    set_private_attr(api, "_check_logged_in", AsyncMock(side_effect=[False, True]))
+    set_private_attr(api, "_check_logged_in", AsyncMock(side_effect=[True]))
     set_private_attr(
         api,
         "_post_page_result",
         AsyncMock(return_value=(HTTPStatus.OK, cookies)),
     )
-    set_private_attr(api, "_sleep_between_call", sleep_mock)
+    set_private_attr(api, "_rate_limiter", limiter_mock)
 
     get_mock = AsyncMock(return_value=(HTTPStatus.NOT_FOUND, page_data))
     set_private_attr(api, "_get_page_result", get_mock)
     assert await login_internal({"code": "9999"}, VEDO) is True
-    sleep_mock.assert_awaited_once_with(SLEEP_AFTER_VEDO_LOGIN)
+    limiter_mock.pause.assert_called_once_with(SLEEP_AFTER_VEDO_LOGIN)
     assert get_private_attr(api, "_is_new_firmware") is new_firmware
 
     http_mock = AsyncMock(return_value=success_response)
@@ -124,22 +132,123 @@ async def test_set_zone_status_success_and_failure(
     assert await api.set_zone_status(1, "dis", force=False) is False
 
 
+async def test_set_zone_status_updates_areas_optimistically(
+    mock_session: ClientSession,
+    fixture_loader: Callable[[str], dict[str, object]],
+) -> None:
+    """Test a successful action updates the known areas until a poll confirms."""
+    api = ComelitVedoApi("127.0.0.1", 80, "9999", mock_session, new_firmware=False)
+    responses = [
+        (True, fixture_loader("vedo/area_desc")),
+        (True, fixture_loader("vedo/zone_desc")),
+        (True, fixture_loader("vedo/area_stat")),
+        (True, fixture_loader("vedo/zone_stat")),
+    ]
+    set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=responses))
+    areas = (await api.get_all_areas_and_zones())[ALARM_AREA]
+    assert all(area.human_status == AlarmAreaState.ARMED for area in areas.values())
+
+    set_private_attr(
+        api, "_get_page_result", AsyncMock(return_value=(HTTPStatus.OK, {}))
+    )
+    assert await api.set_zone_status(0, "dis") is True
+    area = cast("ComelitVedoAreaObject", areas[0])
+    assert (area.armed, area.confirmed) == (0, False)
+    assert area.human_status == AlarmAreaState.DISARMED
+    assert all(areas[index].confirmed for index in areas if index != 0)
+
+    assert await api.set_zone_status(32, "tot") is True
+    assert all(
+        cast("ComelitVedoAreaObject", area).human_status == AlarmAreaState.ARMED
+        for area in areas.values()
+    )
+
+    set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=responses[2:]))
+    areas = (await api.get_all_areas_and_zones())[ALARM_AREA]
+    assert all(area.confirmed for area in areas.values())
+
+
+async def test_firmware_detected_once_per_host(mock_session: ClientSession) -> None:
+    """Test the firmware probe runs once per host unless overridden."""
+    cookies = SimpleCookie()
+    cookies["sid"] = "ok"
+    probes: list[AsyncMock] = []
+    for new_firmware in (None, None, False):
+        api = ComelitVedoApi(
+            "127.0.0.1", 80, "9999", mock_session, new_firmware=new_firmware
+        )
+        probe_mock = AsyncMock(return_value=True)
+        probes.append(probe_mock)
+        set_private_attr(api, "_check_new_firmware", probe_mock)
+        set_private_attr(api, "_check_logged_in", AsyncMock(return_value=True))
+        set_private_attr(
+            api, "_post_page_result", AsyncMock(return_value=(HTTPStatus.OK, cookies))
+        )
+        set_private_attr(api, "_rate_limiter", Mock())
+        assert await api.login() is True
+
+    assert [probe.await_count for probe in probes] == [1, 0, 0]
+    assert get_private_attr(api, "_is_new_firmware") is False
+
+
+@pytest.mark.parametrize("firmware_changed", [True, False])
+async def test_set_zone_status_probes_firmware_on_error(
+    mock_session: ClientSession,
+    firmware_changed: bool,
+) -> None:
+    """Test a failed zone action checks the firmware and retries once."""
+    api = ComelitVedoApi("127.0.0.1", 80, "9999", mock_session, new_firmware=False)
+    set_private_attr(
+        api,
+        "_get_page_result",
+        AsyncMock(side_effect=CannotRetrieveData("GET response status 404")),
+    )
+    post_mock = AsyncMock(return_value=(HTTPStatus.NOT_FOUND, SimpleCookie()))
+    set_private_attr(api, "_post_page_result", post_mock)
+    set_private_attr(
+        api, "_check_new_firmware", AsyncMock(return_value=firmware_changed)
+    )
+
+    if firmware_changed:
+        assert await api.set_zone_status(32, "tot") is True
+        post_mock.assert_awaited_once()
+    else:
+        with pytest.raises(CannotRetrieveData):
+            await api.set_zone_status(32, "tot")
+        post_mock.assert_not_awaited()
+
+
 async def test_get_area_status(
     mock_session: ClientSession,
     fixture_loader: Callable[[str], dict[str, object]],
 ) -> None:
-    """Test get_area_status delegates with area fields and stats payload."""
+    """Test get_area_status refreshes the known area object in place."""
     api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
-    area_desc = fixture_loader("vedo/area_desc")
-    area_stat = fixture_loader("vedo/area_stat")
-    description_list = cast("list[str]", area_desc["description"])
-    p1_pres_list = cast("list[bool]", area_desc["p1_pres"])
-    p2_pres_list = cast("list[bool]", area_desc["p2_pres"])
-    area = ComelitVedoAreaObject(
-        index=0,
-        name=description_list[0],
-        p1=p1_pres_list[0],
-        p2=p2_pres_list[0],
+
+    async def fake_async_get(
+        _desc: str,
+        page: str,
+        _present: str | int | None = None,
+    ) -> tuple[bool, dict[str, object]]:
+        """Return the fixture of the page requested."""
+        return True, fixture_loader(f"vedo/{page[5:-5]}")
+
+    set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=fake_async_get))
+    area = (await api.get_areas_status([0]))[0]
+    area.armed = 0
+    area.human_status = AlarmAreaState.DISARMED
+    area.confirmed = False
+
+    updated = await api.get_area_status(area)
+    assert updated is area
+    assert updated.name == "Perimetrale"
+    assert (area.human_status, area.confirmed) == (AlarmAreaState.ARMED, True)
+
+    missing = ComelitVedoAreaObject(
+        index=31,
+        name="Missing",
+        p1=False,
+        p2=False,
         ready=False,
         armed=0,
         alarm=False,
@@ -150,22 +259,39 @@ async def test_get_area_status(
         out_time=False,
         human_status=AlarmAreaState.UNKNOWN,
     )
-    set_private_attr(
-        api,
-        "_async_get_page_data",
-        AsyncMock(return_value=(True, area_stat)),
-    )
-    create_mock = AsyncMock(return_value=area)
-    set_private_attr(api, "_create_area_object", create_mock)
+    with pytest.raises(CannotRetrieveData):
+        await api.get_area_status(missing)
 
-    updated = await api.get_area_status(area)
-    assert updated is area
-    assert updated.name == "Perimetrale"
-    create_mock.assert_awaited_once_with(
-        {"description": ["Perimetrale"], "p1_pres": [0], "p2_pres": [0]},
-        area_stat,
-        0,
-    )
+
+async def test_get_areas_status_single_stat_fetch(
+    mock_session: ClientSession,
+    fixture_loader: Callable[[str], dict[str, object]],
+) -> None:
+    """Test all areas are built from one area_stat and cached descriptions."""
+    api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
+    calls: list[str] = []
+
+    async def fake_async_get(
+        desc: str,
+        page: str,
+        _present: str | int | None = None,
+    ) -> tuple[bool, dict[str, object]]:
+        """Return the fixture of the page requested."""
+        calls.append(desc)
+        return True, fixture_loader(f"vedo/{page[5:-5]}")
+
+    set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=fake_async_get))
+
+    all_areas = await api.get_areas_status()
+    assert len(all_areas) == AREA_COUNT
+    assert calls == ["AREA description", "AREA statistics"]
+
+    calls.clear()
+    areas = await api.get_areas_status([0, 3, 31])
+    assert list(areas) == [0, 3]
+    assert areas[0] is all_areas[0]
+    assert areas[0].name == "Perimetrale"
+    assert calls == ["AREA statistics"]
 
 
 async def test_get_all_areas_and_zones_success(
@@ -181,7 +307,6 @@ async def test_get_all_areas_and_zones_success(
         (True, fixture_loader("vedo/zone_stat")),
     ]
     set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=responses))
-    set_private_attr(api, "_sleep_between_call", AsyncMock())
 
     result = await api.get_all_areas_and_zones()
 
@@ -197,11 +322,9 @@ async def test_get_all_areas_and_zones_cache_for_desc_pages(
 ) -> None:
     """Test cached description pages are reused while stats are refreshed."""
     api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
-    set_private_mapping_item(api, "_json_data", 1, fixture_loader("vedo/area_desc"))
-    set_private_mapping_item(api, "_json_data", 2, fixture_loader("vedo/zone_desc"))
-    set_private_mapping_item(api, "_json_data", 3, fixture_loader("vedo/area_stat"))
-    set_private_mapping_item(api, "_json_data", 4, fixture_loader("vedo/zone_stat"))
-    set_private_attr(api, "_sleep_between_call", AsyncMock())
+    payloads = cast("PayloadStore", get_private_attr(api, "_payloads"))
+    for page in ("area_desc", "zone_desc", "area_stat", "zone_stat"):
+        payloads.set(f"user/{page}.json", fixture_loader(f"vedo/{page}"))
 
     calls: list[str] = []
 
@@ -224,41 +347,266 @@ async def test_get_all_areas_and_zones_cache_for_desc_pages(
     assert calls == ["AREA statistics", "ZONE statistics"]
 
 
+@pytest.mark.parametrize(
+    ("concurrent_stat_fetch", "expected_in_flight"), [(False, 1), (True, 2)]
+)
+async def test_get_all_areas_and_zones_concurrent_stat_fetch(
+    mock_session: ClientSession,
+    fixture_loader: Callable[[str], dict[str, object]],
+    concurrent_stat_fetch: bool,
+    expected_in_flight: int,
+) -> None:
+    """Test the stat pages are requested together only when enabled."""
+    api = ComelitVedoApi(
+        "127.0.0.1",
+        80,
+        "9999",
+        mock_session,
+        concurrent_stat_fetch=concurrent_stat_fetch,
+    )
+    payloads = cast("PayloadStore", get_private_attr(api, "_payloads"))
+    for page in ("area_desc", "zone_desc"):
+        payloads.set(f"user/{page}.json", fixture_loader(f"vedo/{page}"))
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_async_get(
+        _desc: str,
+        page: str,
+        _present: str | int | None = None,
+    ) -> tuple[bool, dict[str, object]]:
+        """Return the fixture of the page requested after a short delay."""
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True, fixture_loader(f"vedo/{page[5:-5]}")
+
+    set_private_attr(api, "_async_get_page_data", fake_async_get)
+
+    result = await api.get_all_areas_and_zones()
+
+    assert len(result[ALARM_AREA]) == AREA_COUNT
+    assert result[ALARM_ZONE][12].human_status.value == "open"
+    assert max_in_flight == expected_in_flight
+
+
+async def test_concurrent_stat_fetch_paced_with_single_relogin(
+    mock_session: ClientSession,
+    fixture_loader: Callable[[str], dict[str, object]],
+) -> None:
+    """Test concurrent stat pages are still paced and share one re-login."""
+    limiter = RateLimiter(20)
+    set_private_attr(limiter, "pause", Mock())
+    api = ComelitVedoApi(
+        "127.0.0.1",
+        80,
+        "9999",
+        mock_session,
+        rate_limiter=limiter,
+        concurrent_stat_fetch=True,
+    )
+    cookies = SimpleCookie()
+    cookies["sid"] = "ok"
+    post_mock = AsyncMock(return_value=(HTTPStatus.OK, cookies))
+    set_private_attr(api, "_post_page_result", post_mock)
+    set_private_attr(api, "_check_logged_in", AsyncMock(return_value=True))
+    set_private_attr(api, "_firmware_known", True)
+    assert await api.login() is True
+    payloads = cast("PayloadStore", get_private_attr(api, "_payloads"))
+    for page in ("area_desc", "zone_desc"):
+        payloads.set(f"user/{page}.json", fixture_loader(f"vedo/{page}"))
+
+    loop = asyncio.get_running_loop()
+    sent: list[tuple[str, float]] = []
+
+    async def fake_get(url: URL, **_kwargs: object) -> AsyncMock:
+        """Reply logged out to the first request of each page."""
+        page = url.path.removeprefix("/user/").removesuffix(".json")
+        logged_out = page not in (name for name, _ in sent)
+        sent.append((page, loop.time()))
+        reply = {"logged": 0} if logged_out else fixture_loader(f"vedo/{page}")
+        return AsyncMock(
+            status=HTTPStatus.OK, read=AsyncMock(return_value=orjson.dumps(reply))
+        )
+
+    set_private_attr(api, "_session", Mock(get=fake_get))
+
+    result = await api.get_all_areas_and_zones()
+
+    assert len(result[ALARM_AREA]) == AREA_COUNT
+    assert post_mock.await_count == 2
+    assert sorted(name for name, _ in sent) == [
+        "area_stat",
+        "area_stat",
+        "zone_stat",
+        "zone_stat",
+    ]
+    times = [time for _, time in sent]
+    assert all(later - earlier >= 0.04 for earlier, later in itertools.pairwise(times))
+
+
+async def test_invalidate_descriptions_reloads_desc_pages(
+    mock_session: ClientSession,
+    fixture_loader: Callable[[str], dict[str, object]],
+    tmp_path: Path,
+) -> None:
+    """Test invalidated description pages are downloaded again."""
+    api = ComelitVedoApi(
+        "127.0.0.1", 80, "9999", mock_session, description_cache_dir=tmp_path
+    )
+    calls: list[str] = []
+
+    async def fake_async_get(
+        desc: str,
+        page: str,
+        _present: str = "present",
+    ) -> tuple[bool, dict[str, object]]:
+        """Return the fixture of the page requested."""
+        calls.append(desc)
+        return True, fixture_loader(f"vedo/{page[5:-5]}")
+
+    set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=fake_async_get))
+
+    await api.get_all_areas_and_zones()
+    await api.get_all_areas_and_zones()
+    payloads = cast("PayloadStore", get_private_attr(api, "_payloads"))
+    assert payloads.version("user/area_desc.json") == 1
+    assert len(calls) == 6
+
+    api.invalidate_descriptions()
+    assert "user/area_desc.json" not in payloads
+    assert "user/area_stat.json" in payloads
+    cache = cast("DescriptionCache", get_private_attr(api, "_description_cache"))
+    assert cache.get("user/area_desc.json") is None
+
+    await api.get_all_areas_and_zones()
+    assert calls[-4:] == [
+        "AREA description",
+        "ZONE description",
+        "AREA statistics",
+        "ZONE statistics",
+    ]
+
+
+async def test_get_all_areas_and_zones_memory_stays_flat(
+    mock_session: ClientSession,
+    fixture_loader: Callable[[str], dict[str, object]],
+) -> None:
+    """Test hundreds of polls keep a single payload per page in memory."""
+    api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
+    fixtures = {
+        page: fixture_loader(f"vedo/{page}")
+        for page in ("area_desc", "zone_desc", "area_stat", "zone_stat")
+    }
+
+    async def fake_async_get(
+        _desc: str,
+        page: str,
+        _present: str = "present",
+    ) -> tuple[bool, dict[str, object]]:
+        """Return a fresh copy of the page requested, as a real poll does."""
+        return True, dict(fixtures[page[5:-5]])
+
+    set_private_attr(api, "_async_get_page_data", fake_async_get)
+    payloads = cast("PayloadStore", get_private_attr(api, "_payloads"))
+
+    for _ in range(20):
+        await api.get_all_areas_and_zones()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(200):
+            await api.get_all_areas_and_zones()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(payloads) == len(fixtures)
+    assert payloads.version("user/zone_stat.json") == 1
+    assert current - baseline < 64 * 1024
+
+
+async def test_get_all_areas_and_zones_warm_start_from_description_cache(
+    mock_session: ClientSession,
+    fixture_loader: Callable[[str], dict[str, object]],
+    tmp_path: Path,
+) -> None:
+    """Test cached description pages are used at once and checked in background."""
+    pages = {
+        "user/area_desc.json": fixture_loader("vedo/area_desc"),
+        "user/zone_desc.json": fixture_loader("vedo/zone_desc"),
+        "user/area_stat.json": fixture_loader("vedo/area_stat"),
+        "user/zone_stat.json": fixture_loader("vedo/zone_stat"),
+    }
+    calls: list[str] = []
+
+    async def fake_async_get(
+        _desc: str,
+        page: str,
+        _present: str | None = None,
+    ) -> tuple[bool, dict[str, object]]:
+        """Return fixture pages while tracking the requested pages."""
+        calls.append(page)
+        return True, pages[page]
+
+    api = ComelitVedoApi(
+        "127.0.0.1", 80, "9999", mock_session, description_cache_dir=tmp_path
+    )
+    set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=fake_async_get))
+    await api.get_all_areas_and_zones()
+    assert get_private_attr(api, "_description_check_task") is None
+
+    calls.clear()
+    api = ComelitVedoApi(
+        "127.0.0.1", 80, "9999", mock_session, description_cache_dir=tmp_path
+    )
+    set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=fake_async_get))
+    result = await api.get_all_areas_and_zones()
+
+    assert len(result[ALARM_AREA]) == AREA_COUNT
+    assert calls == ["user/area_stat.json", "user/zone_stat.json"]
+
+    task = get_private_attr(api, "_description_check_task")
+    assert isinstance(task, asyncio.Task)
+    await task
+    assert calls[2:] == ["user/area_desc.json", "user/zone_desc.json"]
+    assert get_private_attr(api, "_description_check_pending") is False
+
+
 @pytest.mark.parametrize("retry_succeeds", [True, False])
 async def test_get_all_areas_and_zones_login_retry(
     mock_session: ClientSession,
     fixture_loader: Callable[[str], dict[str, object]],
     retry_succeeds: bool,
 ) -> None:
-    """Test login retry behavior when first area fetch fails."""
+    """Test an expired session is renewed once when fetching a page."""
     api = setup_api(ComelitVedoApi, "127.0.0.1", 80, "9999", mock_session)
-    login_mock = AsyncMock(return_value=True)
-    set_private_attr(api, "login", login_mock)
-    set_private_attr(api, "_sleep_between_call", AsyncMock())
-
-    responses = (
-        [
-            (False, fixture_loader("vedo/area_desc")),
-            (True, fixture_loader("vedo/area_desc")),
-            (True, fixture_loader("vedo/zone_desc")),
-            (True, fixture_loader("vedo/area_stat")),
-            (True, fixture_loader("vedo/zone_stat")),
-        ]
+    cookies = SimpleCookie()
+    cookies["sid"] = "ok"
+    post_mock = AsyncMock(return_value=(HTTPStatus.OK, cookies))
+    set_private_attr(api, "_post_page_result", post_mock)
+    set_private_attr(api, "_check_logged_in", AsyncMock(return_value=True))
+    set_private_attr(api, "_firmware_known", True)
+    assert await api.login() is True
+
+    logged_out = {**fixture_loader("vedo/area_desc"), "logged": 0}
+    pages = ("area_desc", "zone_desc", "area_stat", "zone_stat")
+    replies = (
+        [logged_out, *(fixture_loader(f"vedo/{page}") for page in pages)]
         if retry_succeeds
-        else [
-            (False, fixture_loader("vedo/area_desc")),
-            (False, fixture_loader("vedo/area_desc")),
-        ]
+        else [logged_out, logged_out]
     )
-    set_private_attr(api, "_async_get_page_data", AsyncMock(side_effect=responses))
+    fetch_mock = AsyncMock(side_effect=[(HTTPStatus.OK, reply) for reply in replies])
+    set_private_attr(api, "_fetch_page_result", fetch_mock)
 
     if retry_succeeds:
         result = await api.get_all_areas_and_zones()
         assert len(result[ALARM_AREA]) == AREA_COUNT
-        login_mock.assert_awaited_once()
-        return
-
-    with pytest.raises(CannotRetrieveData):
-        await api.get_all_areas_and_zones()
+    else:
+        with pytest.raises(CannotRetrieveData):
+            await api.get_all_areas_and_zones()
 
-    login_mock.assert_awaited_once()
+    assert post_mock.await_count == 2
+    assert fetch_mock.await_count == len(replies)